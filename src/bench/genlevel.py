@@ -0,0 +1,81 @@
+# src/bench/genlevel.py
+"""
+Generator syntetycznych map ASCII (ten sam format co assets/levels/level*.txt).
+
+Mapa to prostokąt podłogi (`.`) z ramką i losowymi dziurami (`#`),
+gracz (`P`) w lewym górnym rogu, drabina (`L`) w prawym dolnym, a wrogowie
+(G/b/S/B) i pułapki (^/X/O) na losowych wolnych kaflach. Ten sam seed daje
+tę samą mapę – wyniki benchmarków są porównywalne między przebiegami.
+"""
+from __future__ import annotations
+
+import random
+from pathlib import Path
+
+# mapa odniesienia ≈ level01: 76×25, 9 wrogów, ~40 pułapek (2,5 % podłogi)
+BASE_ENEMIES = {"G": 1, "b": 1, "S": 4, "B": 3}
+BASE_TRAPS   = 0.025
+TRAP_MIX     = (("^", 0.9), ("X", 0.05), ("O", 0.05))
+
+# skala → (rozmiar mapy, mnożnik wrogów, gęstość pułapek); liczba encji rośnie
+# ×k, a x1000 zostaje na powierzchni x100 (~190 tys. kafli), tylko gęstszej –
+# większa mapa liczyłaby się głównie w kompilacji, nie w update / draw
+PRESETS: dict[str, tuple[tuple[int, int], int, float]] = {
+    "x1":    ((76, 25),   1,    BASE_TRAPS),
+    "x10":   ((240, 80),  10,   BASE_TRAPS),
+    "x100":  ((760, 250), 100,  BASE_TRAPS),
+    "x1000": ((760, 250), 1000, BASE_TRAPS * 10),
+}
+
+
+def generate(cols: int, rows: int, enemies: dict[str, int],
+             trap_density: float = BASE_TRAPS, holes: float = 0.08, seed: int = 0) -> str:
+    """Tekst mapy cols × rows; `enemies` – liczba wrogów na znak (G/b/S/B)."""
+    rng = random.Random(seed)
+    grid = [["#"] * cols for _ in range(rows)]
+    for y in range(1, rows - 1):
+        for x in range(1, cols - 1):
+            grid[y][x] = "#" if rng.random() < holes else "."
+
+    # start i meta z czystym otoczeniem
+    for cx, cy in ((2, 2), (cols - 3, rows - 3)):
+        for y in range(cy - 1, cy + 2):
+            for x in range(cx - 1, cx + 2):
+                grid[y][x] = "."
+    grid[2][2] = "P"
+    grid[rows - 3][cols - 3] = "L"
+
+    free = [(x, y) for y in range(1, rows - 1) for x in range(1, cols - 1)
+            if grid[y][x] == "." and (abs(x - 2) > 2 or abs(y - 2) > 2)]
+    rng.shuffle(free)
+
+    n_traps = int(len(free) * trap_density)
+    want = sum(enemies.values()) + n_traps
+    if want > len(free):
+        raise ValueError(f"za mało podłogi: {want} encji na {len(free)} wolnych kaflach")
+
+    it = iter(free)
+    for ch, n in enemies.items():
+        for _ in range(n):
+            x, y = next(it)
+            grid[y][x] = ch
+    kinds, weights = zip(*TRAP_MIX)
+    for ch in rng.choices(kinds, weights, k=n_traps):
+        x, y = next(it)
+        grid[y][x] = ch
+    return "\n".join("".join(row) for row in grid) + "\n"
+
+
+def preset(name: str, seed: int = 0) -> str:
+    (cols, rows), k, traps = PRESETS[name]
+    return generate(cols, rows, {ch: n * k for ch, n in BASE_ENEMIES.items()}, traps, seed=seed)
+
+
+def write_preset(name: str, out_dir: Path, seed: int = 0) -> Path:
+    """Zapisuje mapę presetu (tylko gdy treść się zmieniła – cache kompilacji zostaje)."""
+    path = out_dir / f"bench_{name}.txt"
+    text = preset(name, seed)
+    if not path.exists() or path.read_text() != text:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text)
+    return path
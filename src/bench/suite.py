@@ -0,0 +1,279 @@
+# src/bench/suite.py
+"""
+Benchmark poziomu na syntetycznych mapach (src/bench/genlevel.py).
+
+    python -m src.bench.suite [--scale x1 x10 x100 x1000] [--mode headless|windowed|both]
+                              [--ticks 300] [--baseline PLIK] [--save-baseline]
+                              [--replay cache/replays/PLIK.rec ...]
+
+Dla każdej skali osobno mierzymy `Level.__init__` (pierwszy raz – z kompilacją
+mapy, potem z cache), `Level.update` i `Level.draw` (w oknie także `flip`).
+Gracz stoi w miejscu i jest nieczuły, więc każdy przebieg robi tę samą pracę.
+Tryby headless / windowed idą w osobnych procesach – sterownik SDL wybiera
+się raz, przy pygame.init().
+
+Nagrania wejścia (src/core/replay.py) dochodzą jako dodatkowe pozycje
+„replay:<nazwa>”: prawdziwa rozgrywka na mapach z gry, odtworzona co do
+bitu – rozjazd stanu końcowego przerywa pomiar, bo nie mierzyłby tej
+samej pracy.
+
+Wynik trafia do JSON-a (domyślnie cache/bench/latest.json) i jest porównywany
+z bazą (cache/bench/baseline.json): metryka wolniejsza o więcej niż
+--tolerance (i o więcej niż --min-delta ms) to regresja, a proces kończy
+się kodem 1.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from ..core.settings import BENCH_DIR, ROOT_DIR, FIXED_STEP, FPS
+from .genlevel import PRESETS, write_preset
+
+MODES = ("headless", "windowed")
+# metryki porównywane z bazą (ścieżka w wyniku)
+COMPARED = (("init_ms",), ("update_ms", "median"), ("update_ms", "p95"),
+            ("draw_ms", "median"), ("draw_ms", "p95"))
+
+
+def _stats(samples: list[float]) -> dict:
+    s = sorted(samples)
+    return {"median": statistics.median(s), "p95": s[min(len(s) - 1, int(len(s) * 0.95))],
+            "mean": statistics.fmean(s), "max": s[-1]}
+
+
+def _start(game, path: Path):
+    from ..levels.level import Level
+    level = Level(game, filename=str(path))
+    game.player = level.player
+    game.states.change(level)
+    return level
+
+
+# ────────────────────────────────────────────────────────────────
+# POMIAR
+
+def bench_level(game, path: Path, ticks: int, repeat: int, windowed: bool) -> dict:
+    import pygame
+
+    t = time.perf_counter()
+    level = _start(game, path)
+    init_cold = time.perf_counter() - t
+    inits = []
+    for _ in range(repeat):
+        t = time.perf_counter()
+        level = _start(game, path)
+        inits.append(time.perf_counter() - t)
+
+    dt = FIXED_STEP or 1.0 / FPS
+    updates, draws, flips = [], [], []
+    for i in range(ticks + 10):                 # 10 ticków rozgrzewki
+        level.player.invul_timer = 1e9
+        t0 = time.perf_counter()
+        level.update(dt)
+        t1 = time.perf_counter()
+        level.draw(game.screen)
+        t2 = time.perf_counter()
+        if windowed:
+            pygame.display.flip()
+        t3 = time.perf_counter()
+        if i >= 10:
+            updates.append((t1 - t0) * 1000)
+            draws.append((t2 - t1) * 1000)
+            flips.append((t3 - t2) * 1000)
+        if game.game_over_flag or game.states.state is not level:
+            raise RuntimeError(f"{path.name}: poziom skończył się w trakcie pomiaru")
+
+    out = {
+        "map":          path.name,
+        "entities":     len(level.world) + getattr(level.streamer, "pending", 0)
+                        + getattr(level.streamer, "sleeping", 0),
+        "init_cold_ms": init_cold * 1000,
+        "init_ms":      statistics.median(inits) * 1000,
+        "update_ms":    _stats(updates),
+        "draw_ms":      _stats(draws),
+    }
+    if windowed:
+        out["flip_ms"] = _stats(flips)
+    return out
+
+
+def bench_replay(game, path: Path, windowed: bool) -> dict:
+    import pygame
+    from ..core.replay import Recording, play
+
+    rec = Recording.load(path)
+    r = play(game, rec, present=pygame.display.flip if windowed else None)
+    if not r["complete"] or rec.digest not in (None, r["digest"]):
+        raise RuntimeError(f"{path.name}: odtworzenie rozjechało się z nagraniem")
+    out = {
+        "map":       rec.level,
+        "ticks":     r["ticks"],
+        "update_ms": _stats(r["update_ms"]),
+        "draw_ms":   _stats(r["draw_ms"]),
+    }
+    if windowed:
+        out["flip_ms"] = _stats(r["present_ms"])
+    return out
+
+
+def run_mode(mode: str, scales: list[str], ticks: int, repeat: int, seed: int,
+             replays: list[Path] = ()) -> dict:
+    """Wszystkie skale w jednym trybie – w bieżącym procesie."""
+    from ..core import headless
+    from ..core.input import NO_KEYS
+
+    if mode == "headless":
+        headless.use_dummy_drivers()
+    game = headless.make_game(keys=lambda: NO_KEYS)
+
+    import pygame
+    results = {}
+    for scale in scales:
+        path = write_preset(scale, BENCH_DIR / "levels", seed)
+        results[f"{mode}/{scale}"] = bench_level(game, path, ticks, repeat, mode == "windowed")
+        r = results[f"{mode}/{scale}"]
+        print(f"{mode}/{scale}: {r['entities']} encji, init {r['init_ms']:.1f} ms "
+              f"(pierwszy {r['init_cold_ms']:.0f} ms), update {r['update_ms']['median']:.2f} ms, "
+              f"draw {r['draw_ms']['median']:.2f} ms", flush=True)
+    for path in replays:
+        r = results[f"{mode}/replay:{path.stem}"] = bench_replay(game, path, mode == "windowed")
+        print(f"{mode}/replay:{path.stem}: {r['ticks']} ticków na {r['map']}, "
+              f"update {r['update_ms']['median']:.2f} ms, draw {r['draw_ms']['median']:.2f} ms", flush=True)
+    return {"driver": pygame.display.get_driver(), "results": results}
+
+
+def _run_child(mode: str, args) -> dict | None:
+    """Tryb w osobnym procesie (inny sterownik SDL); None – nie dał rady (np. brak ekranu)."""
+    with tempfile.TemporaryDirectory() as tmp:
+        out = Path(tmp) / "out.json"
+        cmd = [sys.executable, "-m", "src.bench.suite", "--mode", mode, "--out", str(out),
+               "--no-compare", "--ticks", str(args.ticks), "--repeat", str(args.repeat),
+               "--seed", str(args.seed), "--scale", *args.scale]
+        if args.replay:
+            cmd += ["--replay", *map(str, args.replay)]
+        if subprocess.run(cmd, cwd=ROOT_DIR).returncode != 0 or not out.exists():
+            print(f"{mode}: pominięty (proces zakończył się błędem)")
+            return None
+        return json.loads(out.read_text())
+
+
+def _meta(args) -> dict:
+    try:
+        import numpy
+        np_version = numpy.__version__
+    except ImportError:
+        np_version = None
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT_DIR,
+                                capture_output=True, text=True).stdout.strip() or None
+    except OSError:
+        commit = None
+    import pygame
+    return {
+        "time":     time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "commit":   commit,
+        "python":   platform.python_version(),
+        "pygame":   pygame.version.ver,
+        "numpy":    np_version,
+        "platform": platform.platform(),
+        "cpus":     os.cpu_count(),
+        "ticks":    args.ticks,
+        "seed":     args.seed,
+    }
+
+
+# ────────────────────────────────────────────────────────────────
+# PORÓWNANIE Z BAZĄ
+
+def _get(d: dict, path: tuple[str, ...]):
+    for k in path:
+        if not isinstance(d, dict) or k not in d:
+            return None
+        d = d[k]
+    return d
+
+
+def compare(base: dict, new: dict, tolerance: float, min_delta: float = 0.05) -> list[str]:
+    """Wypisuje zmiany względem bazy; zwraca listę regresji (wolniej o > tolerance i > min_delta ms)."""
+    regressions = []
+    for key, res in new["results"].items():
+        old = base.get("results", {}).get(key)
+        if old is None:
+            print(f"{key}: brak w bazie")
+            continue
+        for path in COMPARED:
+            a, b = _get(old, path), _get(res, path)
+            if not a or b is None:
+                continue
+            ratio = b / a
+            name = f"{key} {'.'.join(path)}"
+            mark = ""
+            if ratio > 1 + tolerance and b - a > min_delta:
+                mark = "  ▲ wolniej"
+                regressions.append(name)
+            elif ratio < 1 - tolerance and a - b > min_delta:
+                mark = "  ▼ szybciej"
+            print(f"{name:40s} {a:9.2f} → {b:9.2f} ms  ({(ratio - 1) * 100:+.0f} %){mark}")
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(prog="python -m src.bench.suite",
+                                 description="Benchmark Level.__init__/update/draw na mapach syntetycznych.")
+    ap.add_argument("--scale", nargs="*", choices=list(PRESETS), default=["x1", "x10", "x100"])
+    ap.add_argument("--mode", choices=(*MODES, "both"), default="headless")
+    ap.add_argument("--ticks", type=int, default=300, help="mierzone klatki update + draw")
+    ap.add_argument("--repeat", type=int, default=3, help="powtórzenia Level.__init__")
+    ap.add_argument("--seed", type=int, default=0, help="seed generatora map")
+    ap.add_argument("--replay", nargs="+", type=Path, default=[],
+                    help="nagrania wejścia (python -m src.core.game --record) do odtworzenia")
+    ap.add_argument("--out", type=Path, default=BENCH_DIR / "latest.json")
+    ap.add_argument("--baseline", type=Path, default=BENCH_DIR / "baseline.json")
+    ap.add_argument("--save-baseline", action="store_true", help="zapisz wynik jako nową bazę")
+    ap.add_argument("--no-compare", action="store_true")
+    ap.add_argument("--tolerance", type=float, default=0.10, help="próg regresji (0.10 = 10 %%)")
+    ap.add_argument("--min-delta", type=float, default=0.05,
+                    help="pomijaj różnice mniejsze niż tyle ms (szum przy krótkich klatkach)")
+    args = ap.parse_args(argv)
+
+    if args.mode == "both":
+        report = {"drivers": {}, "results": {}}
+        for mode in MODES:
+            part = _run_child(mode, args)
+            if part is not None:
+                report["drivers"].update(part["drivers"])
+                report["results"].update(part["results"])
+    else:
+        part = run_mode(args.mode, args.scale, args.ticks, args.repeat, args.seed, args.replay)
+        report = {"drivers": {args.mode: part["driver"]}, "results": part["results"]}
+    report = {"meta": _meta(args), **report}
+
+    args.out.parent.mkdir(parents=True, exist_ok=True)
+    args.out.write_text(json.dumps(report, indent=2))
+    print(f"wynik → {args.out}")
+    if args.save_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(report, indent=2))
+        print(f"baza → {args.baseline}")
+        return 0
+
+    if args.no_compare or not args.baseline.exists():
+        return 0
+    regressions = compare(json.loads(args.baseline.read_text()), report, args.tolerance, args.min_delta)
+    if regressions:
+        print(f"regresje ({len(regressions)}): " + ", ".join(regressions))
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
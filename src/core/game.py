@@ -1,26 +1,52 @@
 # src/core/game.py
 import sys
+
+# pomiar startu (--startup-report) musi ruszyć przed resztą importów
+from .startup import startup, REPORT_FLAG
+startup.begin(REPORT_FLAG in sys.argv)
+
 import time
+import random
 import pygame
 
 from pathlib import Path
-from .settings      import WIDTH, HEIGHT, FPS, LVL_DIR           # ← LVL_DIR
+from .settings      import (WIDTH, HEIGHT, FPS, LVL_DIR, DIRTY_RECTS, FIXED_STEP,
+                            FIXED_STEP_ON, MAX_CATCHUP)
 from .state_machine import StateMachine
-from ..ui.menu      import MainMenu
-from ..levels.level import Level
+from .profiler      import FrameProfiler, TOGGLE_KEY, EXPORT_KEY
+from .input         import InputRecorder
+from ..ui.text      import font, TextCache
+from ..ui.loading   import LoadingScreen
+# MainMenu (pygame_menu) i Level importujemy dopiero przy pierwszym użyciu
+
+RECORD_FLAG = "--record"          # nagrywanie wejścia (src/core/replay.py); wymusza stały krok
+FIXED_STEP_FLAG = "--fixed-step"  # stały krok symulacji z interpolacją rysowania
 
 
 class Game:
     def __init__(self):
         self.nick = "Player"  # domyślny nick
 
-        pygame.init()
-        pygame.mixer.init()
+        with startup.step("pygame.init"):
+            pygame.init()
+        with startup.step("pygame.mixer.init"):
+            pygame.mixer.init()
 
         # stałe okno
-        self.screen = pygame.display.set_mode((WIDTH, HEIGHT), 0)
-        pygame.display.set_caption("Prince of Persia EDU")
+        with startup.step("display.set_mode"):
+            self.screen = pygame.display.set_mode((WIDTH, HEIGHT), 0)
+            pygame.display.set_caption("Prince of Persia EDU")
         self.clock = pygame.time.Clock()
+        self.dirty_rects = DIRTY_RECTS   # tryb brudnych prostokątów
+        self.fixed_step  = FIXED_STEP    # None → zmienny krok
+        self.keys = pygame.key.get_pressed   # wejście gracza (src/core/input.py – wstrzykiwane)
+        self.profiler = FrameProfiler()      # F3 nakładka, F4 zapis CSV
+        self.seed = None                 # ziarno sesji → Level.rng (None – z `random`)
+        self.save_scores = True          # odtwarzanie / symulacja nie psują tabeli wyników
+        self.record   = False            # --record: każda rozgrywka do cache/replays
+        self.recorder = None             # InputRecorder w trakcie nagrania
+        self._rec_level = None           # mapa, od której zaczęło się nagranie
+        self._sim_acc    = 0.0           # czas zebrany na kolejne kroki symulacji
 
         # ─── DYNAMICZNA LISTA POZIOMÓW ───────────────────────────
         # zbiera wszystkie pliki level*.txt, sortuje alfabetycznie
@@ -38,19 +64,24 @@ class Game:
         self.game_over_won    = False
         self.game_over_time   = 0.0
         self.game_over_levels = 0
+        self._game_over_text  = TextCache(font(48))
 
-        # begin in main menu
-        self.states = StateMachine(MainMenu(self))
+        # ekran ładowania (assety w tle) → potem main menu
+        with startup.step("LoadingScreen (start preloadera)"):
+            self.states = StateMachine(LoadingScreen(self))
 
     # ──────────────────────────────────────────────────────────────
     def start_level(self):
         """Launch (or restart) current level_index."""
+        from ..levels.level import Level
         if self.level_index >= len(self.levels):
             return  # safety guard – brak kolejnego poziomu
 
         self.start_time = time.time()
 
         fname      = self.levels[self.level_index]
+        if self.record and self.recorder is None:
+            self._begin_recording(fname)          # start z menu; drabina nagrywa dalej
         next_fname = self.levels[self.level_index + 1] \
                      if self.level_index + 1 < len(self.levels) else None
 
@@ -59,6 +90,7 @@ class Game:
         level.camera.update(0, 0)     # ← przywracamy widok startowy
         self.player = level.player    # eksponujemy gracza (HUD / AI)
         self.states.change(level)
+        self._sim_acc = 0.0           # zaległy czas starego poziomu przepada
 
     # ──────────────────────────────────────────────────────────────
     def game_over(self, won: bool):
@@ -71,14 +103,28 @@ class Game:
 
     # ──────────────────────────────────────────────────────────────
     def run(self):
+        from ..ui.menu import MainMenu
+
+        prof = self.profiler
         while True:
             dt = self.clock.tick(FPS) / 1000.0
+            prof.begin_frame()
 
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
+                    self._end_recording()
                     pygame.quit()
                     sys.exit()
 
+                # profiler klatki – działa na każdym ekranie
+                if event.type == pygame.KEYDOWN and event.key == TOGGLE_KEY:
+                    prof.toggle()
+                    continue
+                if event.type == pygame.KEYDOWN and event.key == EXPORT_KEY:
+                    if prof.session:
+                        print(f"profiler: sesja zapisana → {prof.export_csv()}")
+                    continue
+
                 # game-over screen
                 if self.game_over_flag:
                     if event.type == pygame.KEYDOWN and event.key == pygame.K_RETURN:
@@ -91,6 +137,7 @@ class Game:
 
                 # normal state events
                 self.states.state.handle_event(event)
+            prof.lap("events")
 
             # update
             if not self.game_over_flag:
@@ -98,33 +145,99 @@ class Game:
                 if isinstance(self.states.state, MainMenu) and \
                    getattr(self.states.state, "start_pressed", False):
                     self.start_level()
-                self.states.state.update(dt)
+                if self.fixed_step and hasattr(self.states.state, "begin_step"):
+                    self._step_fixed(dt)
+                else:
+                    self.states.state.update(dt)
+                if self.game_over_flag:
+                    self._end_recording()
 
             # draw
             if self.game_over_flag:
                 self._draw_game_over()
+                prof.draw(self.screen)
+                pygame.display.flip()
+            elif self.dirty_rects and not prof.enabled and hasattr(self.states.state, "draw_dirty"):
+                # (z nakładką profilera rysujemy pełne klatki – Level nie wie, co zasłania)
+                rects = self.states.state.draw_dirty(self.screen)
+                if rects is None:            # pełna klatka (np. ruch kamery)
+                    pygame.display.flip()
+                elif rects:
+                    pygame.display.update(rects)
             else:
                 self.states.state.draw(self.screen)
+                prof.draw(self.screen)
+                pygame.display.flip()
+            prof.lap("present")
+            prof.end_frame()
+
+            if startup.enabled and isinstance(self.states.state, MainMenu):
+                startup.finish()             # pierwsza interaktywna klatka
 
-            pygame.display.flip()
+    # ──────────────────────────────────────────────────────────────
+    def _step_fixed(self, dt: float):
+        """
+        Stały krok: symulacja zawsze dostaje `fixed_step`, niezależnie od
+        tempa rysowania. Po przycięciu (najwyżej MAX_CATCHUP kroków) gra
+        zwalnia zamiast przeskakiwać przez kontrole podłogi; reszta czasu
+        służy do interpolacji rysowania.
+        """
+        step  = self.fixed_step
+        state = self.states.state
+        advance = getattr(self.keys, "advance", None)     # źródło wejścia z tickami
+        self._sim_acc = min(self._sim_acc + dt, step * MAX_CATCHUP)
+        while self._sim_acc >= step:
+            self._sim_acc -= step
+            state.begin_step()
+            if advance is not None:
+                advance()
+            state.update(step)
+            if self.states.state is not state or self.game_over_flag:
+                return                       # nowy poziom / koniec gry
+        state.interpolate(self._sim_acc / step)
+
+    # ──────────────────────────────────────────────────────────────
+    def _begin_recording(self, fname: str):
+        if not self.fixed_step:
+            print("nagrywanie: wymaga stałego kroku (FIXED_STEP) – pomijam")
+            self.record = False
+            return
+        self.seed = random.getrandbits(32)       # nowa sesja – nowe ziarno
+        self.recorder = self.keys = InputRecorder(self.keys)
+        self._rec_level = fname
+
+    def _end_recording(self):
+        """Zapisuje nagranie (koniec gry / wyjście) razem ze skrótem stanu końcowego."""
+        if self.recorder is None:
+            return
+        from .replay import Recording, state_digest
+        rec, state = self.recorder, self.states.state
+        digest = state_digest(state) if hasattr(state, "begin_step") else None
+        path = Recording(self._rec_level, self.seed, self.fixed_step, rec.masks, digest).save()
+        print(f"nagrywanie: {len(rec.masks)} ticków → {path}")
+        self.recorder, self.keys, self.seed = None, rec.source, None
 
     # ──────────────────────────────────────────────────────────────
     def _draw_game_over(self):
         self.screen.fill((0, 0, 0))
-        font = pygame.font.Font(None, 48)
+        text_cache = self._game_over_text     # render tylko przy zmianie tekstu
 
         if self.game_over_won:
             text = f"Congratulations! You finished {self.game_over_levels} level(s) in {int(self.game_over_time)}s"
         else:
             text = f"Game Over! Levels cleared: {self.game_over_levels}  Time: {int(self.game_over_time)}s"
-        surf = font.render(text, True, (255, 255, 255))
+        surf = text_cache.render("result", text, (255, 255, 255))
         rect = surf.get_rect(center=(WIDTH // 2, HEIGHT // 2))
         self.screen.blit(surf, rect)
 
-        info = font.render("Press Enter to return to menu", True, (200, 200, 200))
+        info = text_cache.render("info", "Press Enter to return to menu", (200, 200, 200))
         r2 = info.get_rect(center=(WIDTH // 2, HEIGHT // 2 + 60))
         self.screen.blit(info, r2)
 
 
 if __name__ == "__main__":
-    Game().run()
+    game = Game()
+    game.record = RECORD_FLAG in sys.argv
+    if game.record or FIXED_STEP_FLAG in sys.argv:
+        game.fixed_step = game.fixed_step or FIXED_STEP_ON
+    game.run()
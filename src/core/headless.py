@@ -0,0 +1,118 @@
+# src/core/headless.py
+"""
+Symulacja bez okna, szybciej niż w czasie rzeczywistym.
+
+    python -m src.core.headless [--level level01.txt] [--ticks 3600]
+                                [--no-draw] [--input idle|random] [--seed 0]
+
+SDL dostaje sterowniki dummy (obraz i dźwięk), zegar nie ogranicza
+klatek, a gracz czyta klawisze ze wstrzykniętego źródła (src/core/input.py).
+Każdy tick to jeden krok symulacji o stałym dt (FIXED_STEP); rysowanie do
+niewidocznego ekranu można wyłączyć, żeby mierzyć samą symulację. Po
+śmierci / końcu poziomu poziom startuje od nowa – do testów wytrzymałościowych;
+wyniki z takich przebiegów nie trafiają do saves/scores.json (Game.save_scores).
+Na koniec wypisujemy ticki na sekundę i osobno koszt update / draw.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import time
+
+
+def use_dummy_drivers() -> None:
+    """Bez okna i karty dźwiękowej – przed pierwszym pygame.init()."""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+
+def make_game(keys=None):
+    """Game z rozgrzanymi assetami (preloader dokończony od razu), bez menu i zapisu wyników."""
+    from .game import Game
+    from ..ui.loading import LoadingScreen
+
+    game = Game()
+    state = game.states.state
+    if isinstance(state, LoadingScreen):
+        while not state.preloader.done:
+            state.preloader.poll(budget_ms=50.0)
+            time.sleep(0.001)
+    if keys is not None:
+        game.keys = keys
+    game.save_scores = False
+    return game
+
+
+def run(game, level: str, ticks: int, draw: bool = True, seed: int = 0) -> dict:
+    """Krokuje `level` przez `ticks` kroków tak szybko, jak się da; zwraca statystyki."""
+    from .settings import FIXED_STEP, FPS
+
+    dt = FIXED_STEP or 1.0 / FPS
+    advance = getattr(game.keys, "advance", None)
+    index = game.levels.index(level)
+    game.level_index = index
+    game.save_scores = False                     # także gdy Game nie jest z make_game()
+    random.seed(seed)
+    game.start_level()
+
+    t_update = t_draw = 0.0
+    restarts = 0
+    t0 = time.perf_counter()
+    for _ in range(ticks):
+        if game.game_over_flag or game.level_index != index:
+            restarts += 1                        # śmierć / drabina → od nowa
+            game.game_over_flag = False
+            game.level_index = index
+            game.start_level()
+        state = game.states.state
+
+        t = time.perf_counter()
+        if advance is not None:
+            advance()
+        state.update(dt)
+        t_update += time.perf_counter() - t
+
+        if draw and not game.game_over_flag:
+            t = time.perf_counter()
+            game.states.state.draw(game.screen)
+            t_draw += time.perf_counter() - t
+    wall = time.perf_counter() - t0
+
+    return {
+        "level":     level,
+        "ticks":     ticks,
+        "seconds":   wall,
+        "tps":       ticks / wall if wall else float("inf"),
+        "update_ms": t_update / ticks * 1000,
+        "draw_ms":   t_draw / ticks * 1000 if draw else 0.0,
+        "sim_speed": ticks * dt / wall if wall else float("inf"),   # × czas rzeczywisty
+        "restarts":  restarts,
+    }
+
+
+def main(argv: list[str] | None = None) -> None:
+    ap = argparse.ArgumentParser(prog="python -m src.core.headless",
+                                 description="Symulacja poziomów bez okna i limitu klatek.")
+    ap.add_argument("--level", action="append",
+                    help="plik mapy (można kilka razy; domyślnie wszystkie)")
+    ap.add_argument("--ticks", type=int, default=3600, help="kroki na poziom")
+    ap.add_argument("--no-draw", action="store_true", help="sama symulacja, bez rysowania")
+    ap.add_argument("--input", choices=("idle", "random"), default="random")
+    ap.add_argument("--seed", type=int, default=0)
+    args = ap.parse_args(argv)
+
+    use_dummy_drivers()
+    from .input import NO_KEYS, RandomInput
+    keys = RandomInput(args.seed) if args.input == "random" else (lambda: NO_KEYS)
+    game = make_game(keys)
+
+    for level in args.level or game.levels:
+        s = run(game, level, args.ticks, draw=not args.no_draw, seed=args.seed)
+        print(f"{s['level']}: {s['ticks']} ticków w {s['seconds']:.2f} s → {s['tps']:.0f} tick/s "
+              f"({s['sim_speed']:.1f}× czas rzeczywisty), update {s['update_ms']:.2f} ms, "
+              f"draw {s['draw_ms']:.2f} ms, restarty {s['restarts']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+# src/core/input.py
+"""
+Wstrzykiwane źródła wejścia gracza.
+
+`Player.handle_input` woła `self.keys()` i indeksuje wynik stałymi
+`pygame.K_*` – domyślnie to `pygame.key.get_pressed`. Każde źródło stąd
+zachowuje się tak samo, więc gra nie odróżnia klawiatury od skryptu.
+Źródła z czasem (skrypt, losowe, nagranie) przesuwa się o tick przez
+`advance()`, raz na krok symulacji (Game._step_fixed, src/core/headless.py).
+"""
+from __future__ import annotations
+
+import random
+from typing import Iterable
+
+import pygame
+
+# klawisze, których używa gra
+GAME_KEYS = (pygame.K_LEFT, pygame.K_RIGHT, pygame.K_UP, pygame.K_DOWN,
+             pygame.K_SPACE, pygame.K_g)
+
+
+class KeyState:
+    """Stan klawiszy jak z pygame.key.get_pressed(): keys[K_LEFT] → bool."""
+    __slots__ = ("pressed",)
+
+    def __init__(self, pressed: Iterable[int] = ()):
+        self.pressed = frozenset(pressed)
+
+    def __getitem__(self, key: int) -> bool:
+        return key in self.pressed
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, KeyState) and self.pressed == other.pressed
+
+    def __hash__(self) -> int:
+        return hash(self.pressed)
+
+
+NO_KEYS = KeyState()
+
+# maska bitowa GAME_KEYS ↔ KeyState (nagrania: bajt na tick)
+KEY_STATES = tuple(KeyState(k for i, k in enumerate(GAME_KEYS) if m >> i & 1)
+                   for m in range(1 << len(GAME_KEYS)))
+
+
+def key_mask(keys) -> int:
+    return sum(1 << i for i, k in enumerate(GAME_KEYS) if keys[k])
+
+
+class ScriptedInput:
+    """Wejście ze skryptu: [(tick, klawisze), ...] – klawisze trzymane do następnego wpisu."""
+
+    def __init__(self, script: Iterable[tuple[int, Iterable[int]]]):
+        self.script = sorted((t, KeyState(k)) for t, k in script)
+        self.tick  = 0
+        self._i    = 0
+        self.state = NO_KEYS
+        self._apply()
+
+    def _apply(self) -> None:
+        while self._i < len(self.script) and self.script[self._i][0] <= self.tick:
+            self.state = self.script[self._i][1]
+            self._i += 1
+
+    def advance(self) -> None:
+        self.tick += 1
+        self._apply()
+
+    def __call__(self) -> KeyState:
+        return self.state
+
+
+class RandomInput:
+    """Losowe ruchy / skoki / ciosy trzymane po kilka ticków – do testów wytrzymałościowych."""
+
+    def __init__(self, seed: int = 0, hold: tuple[int, int] = (10, 60)):
+        self.rng  = random.Random(seed)     # własny generator – nie rusza `random` gry
+        self.hold = hold
+        self._left = 0
+        self.state = NO_KEYS
+
+    def advance(self) -> None:
+        self._left -= 1
+        if self._left > 0:
+            return
+        self._left = self.rng.randint(*self.hold)
+        keys = set()
+        h = self.rng.choice((None, pygame.K_LEFT, pygame.K_RIGHT))
+        v = self.rng.choice((None, pygame.K_UP, pygame.K_DOWN))
+        keys.update(k for k in (h, v) if k is not None)
+        if self.rng.random() < 0.15:
+            keys.add(pygame.K_SPACE)
+        if self.rng.random() < 0.3:
+            keys.add(pygame.K_g)
+        self.state = KeyState(keys)
+
+    def __call__(self) -> KeyState:
+        return self.state
+
+
+class InputRecorder:
+    """
+    Przepuszcza `source` (np. klawiaturę) i zapisuje jej stan raz na tick.
+    Gracz dostaje stan zapamiętany przy `advance()` – dokładnie to, co
+    potem odda ReplayInput.
+    """
+
+    def __init__(self, source):
+        self.source = source
+        self.masks  = bytearray()
+        self.state  = NO_KEYS
+
+    def advance(self) -> None:
+        advance = getattr(self.source, "advance", None)
+        if advance is not None:
+            advance()
+        mask = key_mask(self.source())
+        self.masks.append(mask)
+        self.state = KEY_STATES[mask]
+
+    def __call__(self) -> KeyState:
+        return self.state
+
+
+class ReplayInput:
+    """Odtwarza maski z InputRecorder tick po ticku; po końcu nagrania – nic nie wciśnięte."""
+
+    def __init__(self, masks: bytes):
+        self.masks = bytes(masks)
+        self.tick  = 0
+        self.state = NO_KEYS
+
+    @property
+    def done(self) -> bool:
+        return self.tick >= len(self.masks)
+
+    def advance(self) -> None:
+        self.state = KEY_STATES[self.masks[self.tick]] if not self.done else NO_KEYS
+        self.tick += 1
+
+    def __call__(self) -> KeyState:
+        return self.state
@@ -0,0 +1,158 @@
+# src/core/profiler.py
+"""
+Profiler klatki: czasy faz Level.update / warstw Level.draw w grze.
+
+F3 włącza / wyłącza nakładkę, F4 zapisuje sesję (klatki od włączenia)
+do cache/profiles/*.csv. Kod gry woła `lap("faza")` po każdej fazie –
+czas od poprzedniego `lap` idzie na konto tej fazy, więc fazy sumują się
+do całej klatki. Wyłączony profiler kończy `lap` na jednym sprawdzeniu flagi.
+
+Nakładka pokazuje percentyle czasu klatki i średnie faz z bufora
+kołowego ostatnich PROFILE_WINDOW klatek; tekst odświeżamy kilka razy
+na sekundę, żeby sama nakładka nie zaśmiecała pomiaru.
+"""
+from __future__ import annotations
+
+import csv
+import time
+from collections import deque
+from pathlib import Path
+
+import pygame
+
+from .settings import PROFILE_WINDOW, PROFILE_SESSION_MAX, PROFILE_DIR, WIDTH
+
+TOGGLE_KEY = pygame.K_F3
+EXPORT_KEY = pygame.K_F4
+REFRESH    = 0.25                     # [s] odświeżanie tekstu nakładki
+TOP_PHASES = 14                       # ile faz na nakładce
+
+
+def percentile(sorted_vals: list[float], q: float) -> float:
+    if not sorted_vals:
+        return 0.0
+    return sorted_vals[min(len(sorted_vals) - 1, int(len(sorted_vals) * q))]
+
+
+class FrameProfiler:
+    def __init__(self, window: int = PROFILE_WINDOW):
+        self.enabled = False
+        self.context = ""                              # np. nazwa mapy – kolumna w CSV
+        self.frames: deque[tuple[float, dict[str, float]]] = deque(maxlen=window)
+        self.session: list[tuple[int, str, float, dict[str, float]]] = []
+        self._frame_no = 0
+        self._cur: dict[str, float] = {}
+        self._t0 = self._t = 0.0
+        self._types: dict[type, str] = {}              # klasa → "entity.<nazwa>"
+        self._lines: list[tuple[pygame.Surface, pygame.Surface | None]] = []
+        self._next_refresh = 0.0
+        self._font = None
+
+    # ────────────────────────────────────────────────────────────
+    # POMIAR
+    def toggle(self) -> None:
+        self.enabled = not self.enabled
+        self.frames.clear()
+        self.session.clear()                           # nowa sesja
+        self._lines = []
+        self._t0 = 0.0                                 # przełączone w trakcie klatki – nie liczymy jej
+
+    def begin_frame(self) -> None:
+        if not self.enabled:
+            return
+        self._cur = {}
+        self._t0 = self._t = time.perf_counter()
+
+    def lap(self, name: str) -> None:
+        """Czas od poprzedniego `lap` (albo początku klatki) → faza `name`."""
+        if not self.enabled:
+            return
+        t = time.perf_counter()
+        self._cur[name] = self._cur.get(name, 0.0) + (t - self._t) * 1000
+        self._t = t
+
+    def lap_type(self, spr) -> None:
+        """Jak `lap`, z fazą wg klasy sprite'a (koszt update na typ encji)."""
+        name = self._types.get(type(spr))
+        if name is None:
+            name = self._types[type(spr)] = f"entity.{type(spr).__name__}"
+        self.lap(name)
+
+    def end_frame(self) -> None:
+        if not self.enabled or not self._t0:
+            return
+        self.lap("other")
+        total = (self._t - self._t0) * 1000
+        self.frames.append((total, self._cur))
+        if len(self.session) < PROFILE_SESSION_MAX:
+            self.session.append((self._frame_no, self.context, total, self._cur))
+        self._frame_no += 1
+
+    # ────────────────────────────────────────────────────────────
+    # WYNIKI
+    def summary(self) -> tuple[dict[str, float], dict[str, float]]:
+        """(percentyle czasu klatki, średni czas faz) z bufora kołowego."""
+        totals = sorted(t for t, _ in self.frames)
+        pct = {"p50": percentile(totals, 0.50), "p95": percentile(totals, 0.95),
+               "p99": percentile(totals, 0.99), "max": totals[-1] if totals else 0.0}
+        sums: dict[str, float] = {}
+        for _, phases in self.frames:
+            for k, v in phases.items():
+                sums[k] = sums.get(k, 0.0) + v
+        n = len(self.frames) or 1
+        return pct, {k: v / n for k, v in sums.items()}
+
+    def export_csv(self, path: Path | None = None) -> Path:
+        """Zapisuje sesję: wiersz na klatkę, kolumna na fazę [ms]."""
+        if path is None:
+            path = PROFILE_DIR / f"profile_{time.strftime('%Y%m%d_%H%M%S')}.csv"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        phases = sorted({k for *_, ph in self.session for k in ph})
+        with open(path, "w", newline="") as f:
+            w = csv.writer(f)
+            w.writerow(["frame", "level", "total_ms", *phases])
+            for frame, ctx, total, ph in self.session:
+                w.writerow([frame, ctx, f"{total:.4f}", *(f"{ph.get(k, 0.0):.4f}" for k in phases)])
+        return path
+
+    # ────────────────────────────────────────────────────────────
+    # NAKŁADKA
+    def draw(self, screen: pygame.Surface) -> pygame.Rect | None:
+        if not self.enabled:
+            return None
+        now = time.perf_counter()
+        if now >= self._next_refresh:
+            self._next_refresh = now + REFRESH
+            self._lines = self._render_lines()
+        if not self._lines:
+            return None
+
+        # wiersz = (nazwa, wartość | None); wartości w kolumnie za najdłuższą nazwą
+        col = max((l.get_width() for l, r in self._lines if r is not None), default=0) + 12
+        w = max(l.get_width() if r is None else col + r.get_width() for l, r in self._lines) + 12
+        h = sum(l.get_height() for l, _ in self._lines) + 8
+        panel = pygame.Rect(WIDTH - w - 8, 8, w, h)
+        screen.fill((0, 0, 0), panel)
+        y = panel.y + 4
+        for left, right in self._lines:
+            screen.blit(left, (panel.x + 6, y))
+            if right is not None:
+                screen.blit(right, (panel.x + 6 + col, y))
+            y += left.get_height()
+        return panel
+
+    def _render_lines(self) -> list[tuple[pygame.Surface, pygame.Surface | None]]:
+        if self._font is None:
+            from ..ui.text import font
+            self._font = font(18)
+        fnt = self._font
+        pct, phases = self.summary()
+        total = sum(phases.values()) or 1.0
+        head = (f"klatka ms  p50 {pct['p50']:.2f}  p95 {pct['p95']:.2f}  "
+                f"p99 {pct['p99']:.2f}  max {pct['max']:.2f}  ({len(self.frames)})")
+        lines = [(fnt.render(head, True, (255, 173, 46)), None)]
+        for name, ms in sorted(phases.items(), key=lambda kv: -kv[1])[:TOP_PHASES]:
+            lines.append((fnt.render(name, True, (220, 220, 220)),
+                          fnt.render(f"{ms:6.2f} ms  {ms / total * 100:3.0f} %", True, (220, 220, 220))))
+        lines.append((fnt.render("F3 – ukryj, F4 – zapis CSV", True, (140, 140, 140)), None))
+        return lines
@@ -0,0 +1,153 @@
+# src/core/replay.py
+"""
+Nagrania wejścia gracza i ich odtwarzanie – powtarzalne przebiegi gry.
+
+    python -m src.core.game --record                  # gra z nagrywaniem sesji
+    python -m src.core.replay cache/replays/PLIK.rec [--no-draw] [--repeat 3]
+
+Nagranie to ziarno sesji (Game.seed → Level.rng każdego poziomu), mapa
+startowa, stały krok i maska klawiszy na każdy tick. Przy tym samym
+ziarnie i wejściu symulacja jest deterministyczna, więc odtworzenie
+kończy się w tym samym stanie – sprawdzamy to skrótem stanu zapisanym
+przy nagrywaniu. Odtwarzanie mierzy przy okazji Level.update / Level.draw
+na prawdziwej rozgrywce (też w `python -m src.bench.suite --replay`).
+
+Plik: pierwsza linia – nagłówek JSON, dalej maski (bajt na tick) po zlib.
+"""
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import statistics
+import sys
+import time
+import zlib
+from pathlib import Path
+
+from .settings import REPLAY_DIR
+
+FORMAT = 1
+
+
+class Recording:
+    def __init__(self, level: str, seed: int, step: float, masks: bytes = b"",
+                 digest: str | None = None):
+        self.level  = level             # mapa startowa (kolejne – jak w grze, po drabinach)
+        self.seed   = seed
+        self.step   = step
+        self.masks  = bytes(masks)
+        self.digest = digest            # skrót stanu po ostatnim ticku
+
+    def __len__(self) -> int:
+        return len(self.masks)
+
+    def save(self, path: Path | None = None) -> Path:
+        if path is None:
+            path = REPLAY_DIR / f"{Path(self.level).stem}_{time.strftime('%Y%m%d_%H%M%S')}.rec"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        head = {"format": FORMAT, "level": self.level, "seed": self.seed, "step": self.step,
+                "ticks": len(self.masks), "digest": self.digest}
+        path.write_bytes(json.dumps(head).encode() + b"\n" + zlib.compress(self.masks, 9))
+        return path
+
+    @classmethod
+    def load(cls, path: Path) -> "Recording":
+        head, _, body = Path(path).read_bytes().partition(b"\n")
+        head = json.loads(head)
+        if head.get("format") != FORMAT:
+            raise ValueError(f"{path}: nieznany format nagrania {head.get('format')!r}")
+        masks = zlib.decompress(body)
+        if len(masks) != head["ticks"]:
+            raise ValueError(f"{path}: uszkodzone nagranie ({len(masks)} z {head['ticks']} ticków)")
+        return cls(head["level"], head["seed"], head["step"], masks, head.get("digest"))
+
+
+def state_digest(level) -> str:
+    """Skrót stanu symulacji: gracz, wynik i wszystkie encje (pozycje, rect, HP)."""
+    def key(spr):                       # Vector2.__repr__ zaokrągla – bierzemy floaty
+        pos = getattr(spr, "pos", None)
+        return (type(spr).__name__, tuple(spr.rect), None if pos is None else (pos.x, pos.y),
+                getattr(spr, "hp", None))
+
+    h = hashlib.sha1()
+    h.update(repr((level.filename, level.score, key(level.player))).encode())
+    for spr in level.world:
+        h.update(repr(key(spr)).encode())
+    streamer = level.streamer
+    h.update(repr((getattr(streamer, "pending", 0), getattr(streamer, "sleeping", 0))).encode())
+    return h.hexdigest()
+
+
+def play(game, rec: Recording, draw: bool = True, present=None) -> dict:
+    """
+    Odtwarza `rec` w `game` tak szybko, jak się da. Zwraca czasy update /
+    draw (i `present`, np. flip) [ms] na tick, skrót stanu końcowego i czy
+    przeszły wszystkie ticki. Wejście i ziarno gry wracają potem na swoje.
+    """
+    from .input import ReplayInput
+
+    if rec.level not in game.levels:
+        raise ValueError(f"nagranie z mapy {rec.level}, której nie ma w assets/levels")
+    keys = ReplayInput(rec.masks)
+    saved = game.keys, game.seed, game.save_scores
+    game.keys, game.seed, game.save_scores = keys, rec.seed, False
+    game.level_index = game.levels.index(rec.level)
+    game.game_over_flag = False
+    try:
+        game.start_level()
+        updates, draws, presents = [], [], []
+        while not keys.done and not game.game_over_flag:
+            state = game.states.state
+            t0 = time.perf_counter()
+            keys.advance()
+            state.update(rec.step)
+            t1 = time.perf_counter()
+            updates.append((t1 - t0) * 1000)
+            if draw and not game.game_over_flag:
+                game.states.state.draw(game.screen)
+                t2 = time.perf_counter()
+                draws.append((t2 - t1) * 1000)
+                if present is not None:
+                    present()
+                    presents.append((time.perf_counter() - t2) * 1000)
+        digest = state_digest(game.states.state)
+    finally:
+        game.keys, game.seed, game.save_scores = saved
+    return {
+        "ticks":      keys.tick,
+        "complete":   keys.tick == len(rec),
+        "update_ms":  updates,
+        "draw_ms":    draws,
+        "present_ms": presents,
+        "digest":     digest,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(prog="python -m src.core.replay",
+                                 description="Odtwarza nagranie wejścia i sprawdza stan końcowy.")
+    ap.add_argument("file", type=Path)
+    ap.add_argument("--no-draw", action="store_true", help="sama symulacja, bez rysowania")
+    ap.add_argument("--repeat", type=int, default=1, help="ile razy odtworzyć")
+    args = ap.parse_args(argv)
+
+    from . import headless
+    headless.use_dummy_drivers()
+    rec = Recording.load(args.file)
+    game = headless.make_game()
+
+    ok = True
+    for i in range(args.repeat):
+        r = play(game, rec, draw=not args.no_draw)
+        same = r["complete"] and rec.digest in (None, r["digest"])
+        ok &= same
+        upd = statistics.median(r["update_ms"]) if r["update_ms"] else 0.0
+        drw = statistics.median(r["draw_ms"]) if r["draw_ms"] else 0.0
+        print(f"{args.file.name} #{i + 1}: {r['ticks']}/{len(rec)} ticków, update {upd:.2f} ms, "
+              f"draw {drw:.2f} ms (mediana), stan {'zgodny' if same else 'ROZBIEŻNY'}")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,7 +2,17 @@ from pathlib import Path
 
 # OKNO
 WIDTH, HEIGHT = 960, 540
-FPS = 60
+FPS = 60                    # limit klatek rysowania
+# rysowanie tylko zmienionych obszarów (pełna klatka przy ruchu kamery)
+DIRTY_RECTS = False
+# stały krok symulacji poziomu (None → dt zegara prosto do update, jak dawniej);
+# rysowanie interpoluje pozycje między dwoma ostatnimi krokami
+FIXED_STEP  = None          # [s]
+FIXED_STEP_ON = 1 / 60      # [s] krok włączany przez --fixed-step (i --record)
+MAX_CATCHUP = 5             # najwyżej tyle kroków na klatkę – nadmiar czasu przepada
+# profiler klatki (F3 nakładka, F4 eksport CSV – src/core/profiler.py)
+PROFILE_WINDOW      = 300      # klatki w buforze kołowym nakładki
+PROFILE_SESSION_MAX = 108_000  # klatki w sesji do CSV (~30 min przy 60 FPS)
 # ──────────────────────────────────────────────────────────────
 #  PUNKTACJA
 
@@ -18,6 +28,40 @@ TIME_BONUS = {
 # ROZMIAR KAFELKA I ANIMACJI
 TILE = 128
 
+# przeskalowane animacje zapisywane na dysk (cache/anims/) między uruchomieniami
+BAKE_SCALED_ANIMS = False
+
+# PRELOADER – liczba wątków dekodujących assety przy starcie
+PRELOAD_WORKERS = 4
+
+# ATLAS TEKSTUR – bok arkusza i największa klatka, która do niego trafia
+ATLAS_SHEET     = 2048
+ATLAS_MAX_FRAME = 256
+
+# PODŁOGA – chunki renderowane leniwie (bok w px) i budżet cache LRU
+FLOOR_CHUNK       = 512
+FLOOR_CACHE_BYTES = 16 * 1024 * 1024     # ~16 chunków 512×512 RGBA
+
+# WROGOWIE – wsadowa aktualizacja Bandit/Skeleton (wymaga numpy, bez niej per sprite);
+# przy kilkunastu wrogach narzut NumPy jest większy niż zysk
+BATCH_WALKERS     = True
+BATCH_WALKERS_MIN = 64      # od ilu Bandit/Skeleton na mapie
+
+# LOD AI – wrogowie daleko od gracza i kamery dostają tick co N klatek (z zebranym dt)
+AI_LOD_MIN_ENEMIES = 64                     # od ilu wrogów na mapie
+AI_LOD_TIERS       = ((600, 1), (1500, 3))  # (dystans do gracza [px], co ile klatek)
+AI_LOD_FAR         = 8                      # jeszcze dalej
+AI_LOD_VIEW_MARGIN = 200                    # w kadrze (+ margines) zawsze co klatkę
+
+# STREAMING SEKTORÓW – na dużych mapach encje powstają / zasypiają wg kamery
+SECTOR_SIZE        = 1024    # bok sektora w px
+SECTOR_MARGIN      = 1       # ile sektorów wokół kadru trzymamy aktywnych
+STREAM_MIN_SECTORS = 16      # mniejsze mapy ładują wszystkie encje od razu
+
+# POŚCIG – wspólne pole przepływu (BFS po kaflach od gracza)
+FLOW_RADIUS = 16             # zasięg w krokach kafli (pościg zaczyna się w 250 px)
+FLOW_BUDGET = 512            # najwyżej tyle kafli BFS na klatkę
+
 # ŚCIEŻKI (nie zmieniaj)
 ROOT_DIR = Path(__file__).resolve().parents[2]
 ASSETS   = ROOT_DIR / "assets"
@@ -26,6 +70,13 @@ SND_DIR  = ASSETS / "sounds"
 LVL_DIR  = ASSETS / "levels"
 CFG_DIR  = ROOT_DIR / "config"
 SAVE_DIR = ROOT_DIR / "saves"
+CACHE_DIR      = ROOT_DIR / "cache"
+ANIM_CACHE_DIR = CACHE_DIR / "anims"
+LEVEL_CACHE_DIR = CACHE_DIR / "levels"   # skompilowane mapy (src.levels.compiled)
+BENCH_DIR      = CACHE_DIR / "bench"      # mapy i wyniki `python -m src.bench.suite`
+PROFILE_DIR    = CACHE_DIR / "profiles"   # eksport profilera klatki (F4)
+REPLAY_DIR     = CACHE_DIR / "replays"    # nagrania wejścia (--record, src/core/replay.py)
+ATLAS_DIR      = ASSETS / "atlas"         # wynik `python -m src.utils.atlas`
 DEFAULT_VOLUME = 0.3
 
 # PLIKI AUDIO
@@ -0,0 +1,103 @@
+# src/core/startup.py
+"""
+Raport czasu startu: koszt importów i kroków inicjalizacji.
+
+    python -m src.core.game --startup-report
+
+Podczas startu `builtins.__import__` jest owinięty licznikiem – każdy
+moduł importowany po raz pierwszy dostaje swój czas własny (bez czasu
+modułów, które sam zaimportował). Kroki inicjalizacji mierzymy jawnie
+przez `startup.step(...)`. Raport wypisujemy po pierwszej interaktywnej
+klatce i wtedy zdejmujemy licznik importów.
+"""
+from __future__ import annotations
+
+import builtins
+import sys
+import time
+from contextlib import contextmanager
+from importlib.util import resolve_name
+
+REPORT_FLAG = "--startup-report"
+
+
+class StartupReport:
+    def __init__(self):
+        self.enabled = False
+        self.t0 = time.perf_counter()
+        self.imports: dict[str, float] = {}          # moduł → czas własny [s]
+        self.steps:   list[tuple[str, float]] = []   # (krok, czas [s])
+        self._orig_import = None
+        self._children: list[float] = []             # czas dzieci bieżących importów
+
+    # ────────────────────────────────────────────────────────────
+    def begin(self, enabled: bool) -> None:
+        self.enabled = enabled
+        if enabled and self._orig_import is None:
+            self._orig_import = builtins.__import__
+            builtins.__import__ = self._timed_import
+
+    def _timed_import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        orig = self._orig_import
+        try:
+            absname = resolve_name("." * level + name, (globals or {}).get("__package__")) \
+                if level else name
+        except (ImportError, ValueError):
+            return orig(name, globals, locals, fromlist, level)
+
+        # `from pkg import mod` – liczy się pierwszy jeszcze nie załadowany podmoduł
+        key = absname
+        if absname in sys.modules:
+            missing = [f"{absname}.{f}" for f in fromlist or ()
+                       if f != "*" and f"{absname}.{f}" not in sys.modules
+                       and not hasattr(sys.modules[absname], f)]
+            if not missing:
+                return orig(name, globals, locals, fromlist, level)
+            key = missing[0]
+
+        self._children.append(0.0)
+        t = time.perf_counter()
+        try:
+            return orig(name, globals, locals, fromlist, level)
+        finally:
+            total = time.perf_counter() - t
+            own = total - self._children.pop()
+            self.imports[key] = self.imports.get(key, 0.0) + own
+            if self._children:
+                self._children[-1] += total
+
+    @contextmanager
+    def step(self, label: str):
+        t = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.steps.append((label, time.perf_counter() - t))
+
+    def record(self, label: str, seconds: float) -> None:
+        self.steps.append((label, seconds))
+
+    # ────────────────────────────────────────────────────────────
+    def format(self, top: int = 15) -> str:
+        lines = ["Startup report [ms]"]
+        total_imp = sum(self.imports.values())
+        lines.append(f"  imports (czas własny, top {top} z {len(self.imports)}): {total_imp * 1000:8.1f}")
+        for mod, sec in sorted(self.imports.items(), key=lambda kv: -kv[1])[:top]:
+            lines.append(f"    {mod:<40} {sec * 1000:8.1f}")
+        lines.append("  init steps:")
+        for label, sec in self.steps:
+            lines.append(f"    {label:<40} {sec * 1000:8.1f}")
+        lines.append(f"  first interactive frame at {(time.perf_counter() - self.t0) * 1000:8.1f}")
+        return "\n".join(lines)
+
+    def finish(self) -> None:
+        """Pierwsza interaktywna klatka – wypisz raport i zdejmij licznik importów."""
+        if self._orig_import is not None:
+            builtins.__import__ = self._orig_import
+            self._orig_import = None
+        if self.enabled:
+            print(self.format())
+            self.enabled = False
+
+
+startup = StartupReport()
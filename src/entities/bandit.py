@@ -3,14 +3,15 @@ import random
 import math
 import pygame
 
-from ..utils.loader import load_animation
+from ..utils.loader import scaled_animation
 from .base import BaseEntity
+from .walkers import Batched, vec2
 from ..core.settings import TILE
 
 
 class Bandit(BaseEntity):
     """Bandyta patroluje izometrycznie po całej podłodze, a w promieniu DETECT_RADIUS ściga gracza.
-    Nigdy nie schodzi z kafelków, bo każdy krok jest sprawdzany maską floor_mask."""
+    Nigdy nie schodzi z kafelków, bo każdy krok jest sprawdzany siatką chodliwości poziomu."""
 
     # ───────── STAŁE AI ────────────────────────────────────────────────────────
     DETECT_RADIUS = 250      # zasięg zauważenia gracza   [px]
@@ -29,24 +30,29 @@ class Bandit(BaseEntity):
 
     FOOT_SHIFT_Y = TILE // 2  # obniżenie sprite’a, by stopa trafiała w romb
 
+    SLEEP_STATE = BaseEntity.SLEEP_STATE + ("pos", "dir_iso", "turn_t", "atk_t", "hp")
+
+    batched = False           # True → AI liczy WalkerSystem (src/entities/walkers.py)
+    _row    = None            # (system, wiersz) – we wsadzie pola poniżej żyją w jego tablicach
+    dir_iso = Batched("dir", vec2)
+    turn_t  = Batched("turn_t")
+    atk_t   = Batched("atk_t")
+    hp      = Batched("hp", int)
+
     # ───────────────────────────────────────────────────────────────────────────
-    def __init__(self, pos, groups, game):
-        frames = [
-            pygame.transform.scale(
-                f, (int(f.get_width() * 0.5), int(f.get_height() * 0.5))
-            )
-            for f in load_animation("iso_bandit", 4)
-        ]
+    def __init__(self, pos, groups, game, rng=random):
+        frames = list(scaled_animation("iso_bandit", 4, 0.5))
         animations = {"idle": frames, "run": frames}
         super().__init__(pos, groups, animations, anim_interval=0.12)
 
         self.game = game
+        self.rng  = rng     # strumień losowy poziomu (Level.rng)
         # startujemy lekko niżej, żeby stopa była na podłodze
         self.pos = pygame.math.Vector2(pos[0], pos[1] + self.FOOT_SHIFT_Y)
 
         # losowy kierunek izometryczny (dx,dy ∈ {-1,0,1} \ {(0,0)})
         self._pick_new_dir()
-        self.turn_t = random.uniform(*self.TURN_DELAY)
+        self.turn_t = self.rng.uniform(*self.TURN_DELAY)
 
         # walka
         self.hp    = self.MAX_HP
@@ -55,8 +61,8 @@ class Bandit(BaseEntity):
     # ───────── POMOCNICZE ──────────────────────────────────────────────────────
     def _pick_new_dir(self):
         while True:
-            dx = random.choice((-1, 0, 1))
-            dy = random.choice((-1, 0, 1))
+            dx = self.rng.choice((-1, 0, 1))
+            dy = self.rng.choice((-1, 0, 1))
             if dx or dy:
                 break
         self.dir_iso = pygame.math.Vector2(dx, dy)
@@ -69,32 +75,26 @@ class Bandit(BaseEntity):
     @staticmethod
     def _foot_ok(pos: pygame.math.Vector2,
                  rect: pygame.Rect,
-                 floor_mask: pygame.mask.Mask) -> bool:
+                 walk) -> bool:
         """True jeśli CAŁA szerokość stopy (3 próbki) stoi na podłodze."""
         foot_y = int(pos.y + rect.height - 2)
 
         # lewa ¼, środek, prawa ¾ sprite’a
-        xs = [
-            int(pos.x + rect.width * 0.25),
-            int(pos.x + rect.width * 0.50),
-            int(pos.x + rect.width * 0.75),
-        ]
-        w, h = floor_mask.get_size()
-        for px in xs:
-            if not (0 <= px < w and 0 <= foot_y < h):
-                return False
-            if floor_mask.get_at((px, foot_y)) == 0:
-                return False
-        return True
+        return all(walk.walkable_many((
+            (int(pos.x + rect.width * 0.25), foot_y),
+            (int(pos.x + rect.width * 0.50), foot_y),
+            (int(pos.x + rect.width * 0.75), foot_y),
+        )))
 
     # ───────── GŁÓWNA AKTUALIZACJA ────────────────────────────────────────────
     def update(self, dt: float):
+        if self.batched:
+            return
         level = self.game.states.state
-        floor_mask = getattr(level, "floor_mask", None)
-        if floor_mask is None:
+        walk = getattr(level, "walk", None)
+        if walk is None:
             return
 
-        world_off = level.world_rect.topleft  # ← ♻  przesunięcie mapy
         player = getattr(self.game, "player", None)
         dist_player = (pygame.math.Vector2(player.rect.center) - self.pos).length() \
             if player else 1e9
@@ -102,8 +102,14 @@ class Bandit(BaseEntity):
 
         # ── kierunek / prędkość ───────────────────────────
         if chasing:
+            # krok z pola przepływu poziomu (omija narożniki); bez drogi – wprost na gracza
+            flow = getattr(level, "flow", None)
+            step = flow.step_at(self.pos.x + self.rect.width * 0.5,
+                                self.pos.y + self.rect.height - 2) if flow else None
             vec = pygame.math.Vector2(player.rect.center) - self.pos
-            if vec.length_squared():
+            if step:
+                self.dir_iso = pygame.math.Vector2(step)
+            elif vec.length_squared():
                 self.dir_iso = pygame.math.Vector2(
                     math.copysign(1, vec.x) if abs(vec.x) > abs(vec.y) else 0,
                     math.copysign(1, vec.y) if abs(vec.y) >= abs(vec.x) else 0,
@@ -113,28 +119,14 @@ class Bandit(BaseEntity):
             self.turn_t -= dt
             if self.turn_t <= 0:
                 self._pick_new_dir()
-                self.turn_t = random.uniform(*self.TURN_DELAY)
+                self.turn_t = self.rng.uniform(*self.TURN_DELAY)
             speed = self.SPD_PATROL
 
         # ── próba ruchu ───────────────────────────────────
         vel = self._iso_vel(speed)
         next_pos = self.pos + vel * dt
 
-        # lokalne współrzędne maski
-        test_x = next_pos.x - world_off[0]
-        test_y = next_pos.y - world_off[1]
-        foot_y = int(test_y + self.rect.height - 2)
-        xs = [
-            int(test_x + self.rect.width * 0.25),
-            int(test_x + self.rect.width * 0.50),
-            int(test_x + self.rect.width * 0.75),
-        ]
-        ok = True
-        mw, mh = floor_mask.get_size()
-        for px in xs:
-            if not (0 <= px < mw and 0 <= foot_y < mh) or floor_mask.get_at((px, foot_y)) == 0:
-                ok = False
-                break
+        ok = self._foot_ok(next_pos, self.rect, walk)
 
         if ok:
             self.pos = next_pos
@@ -1,6 +1,11 @@
 import pygame
+from ..utils.loader import frame_mask
 
 class BaseEntity(pygame.sprite.Sprite):
+    # atrybuty zapisywane przy usypianiu sektora (src/levels/sectors.py);
+    # podklasy dopisują swoje (pozycja, hp, timery AI)
+    SLEEP_STATE: tuple[str, ...] = ("state", "frame_index", "anim_timer")
+
     def __init__(self, pos, groups, animations: dict[str, list[pygame.Surface]], anim_interval: float = 0.12):
         super().__init__(groups)
         self.animations    = animations
@@ -9,11 +14,15 @@ class BaseEntity(pygame.sprite.Sprite):
         self.anim_interval = anim_interval  # czas [s] między klatkami
         self.anim_timer    = 0.0
 
-        # ustaw pierwszy obraz i maskę
+        # ustaw pierwszy obraz (maska – leniwie, patrz `mask`)
         self.image = self.animations[self.state][0]
-        self.mask  = pygame.mask.from_surface(self.image)
         self.rect  = self.image.get_rect(topleft=pos)
 
+    @property
+    def mask(self) -> pygame.mask.Mask:
+        """Maska bieżącej klatki z cache (collide_mask czyta ten atrybut)."""
+        return frame_mask(self.image)
+
     def animate(self, dt: float):
         seq = self.animations[self.state]
         self.anim_timer += dt
@@ -24,8 +33,25 @@ class BaseEntity(pygame.sprite.Sprite):
             self.frame_index = (self.frame_index + frames_advance) % len(seq)
             self.anim_timer %= self.anim_interval
             self.image = seq[int(self.frame_index)]
-            self.mask  = pygame.mask.from_surface(self.image)
 
     def update(self, dt: float = 0):
         # dt przekazywane z Game.run()
         self.animate(dt)
+
+    # ────────────────────────────────────────────────────────────
+    def sleep_state(self) -> tuple:
+        """Kompaktowy stan uśpionej encji: rect.topleft i wartości SLEEP_STATE."""
+        vals = tuple(tuple(v) if isinstance(v, pygame.math.Vector2) else v
+                     for v in (getattr(self, k) for k in self.SLEEP_STATE))
+        return self.rect.topleft, vals
+
+    def wake(self, state: tuple) -> None:
+        """Przywraca na świeżo utworzonej encji stan z `sleep_state`."""
+        topleft, vals = state
+        for k, v in zip(self.SLEEP_STATE, vals):
+            if isinstance(getattr(self, k), pygame.math.Vector2):
+                v = pygame.math.Vector2(v)
+            setattr(self, k, v)
+        seq = self.animations[self.state]
+        self.image = seq[int(self.frame_index) % len(seq)]
+        self.rect  = self.image.get_rect(topleft=topleft)
@@ -1,33 +1,51 @@
 # src/entities/player.py
 
 import math
+from weakref import WeakKeyDictionary
+
 import pygame
 from ..core.settings import TILE
-from ..utils.loader import load_animation
+from ..utils.loader import scaled_animation, frame_mask
 from ..core.settings import SND_JUMP, SND_PUNCH
 from ..utils.loader  import play
 from .base import BaseEntity
 
+# warianty alfa do migania (255 / 128 / 0) – jeden komplet na klatkę, wspólny
+# dla wszystkich instancji i restartów poziomu; wpis znika razem z klatką
+_blink: WeakKeyDictionary[pygame.Surface, tuple[pygame.Surface, ...]] = WeakKeyDictionary()
+
+
+def _with_alpha(frame: pygame.Surface, alpha: int) -> pygame.Surface:
+    surf = frame.copy()
+    surf.set_alpha(alpha)
+    return surf
+
+
+def blink_frames(frame: pygame.Surface) -> tuple[pygame.Surface, ...]:
+    """(klatka, pół-przezroczysta, niewidoczna) – liczone przy pierwszym mignięciu."""
+    v = _blink.get(frame)
+    if v is None:
+        v = _blink[frame] = (frame, _with_alpha(frame, 128), _with_alpha(frame, 0))
+    return v
+
+
 class Player(BaseEntity):
-    def __init__(self, pos, groups):
+    def __init__(self, pos, groups, keys=None):
+        # źródło stanu klawiszy – jak pygame.key.get_pressed (headless / replay podmieniają)
+        self.keys = keys or pygame.key.get_pressed
+
+        # skalowanie 128×128 → 64×64 (klatki wspólne dla wszystkich instancji)
         animations = {
-            "idle":   load_animation("iso_prince_hero",        3),
-            "run":    load_animation("iso_prince_hero_run",    3),
-            "climb":  load_animation("iso_prince_hero_climb",  1),
-            "crouch": load_animation("iso_prince_crouch",      1),
-            "attack": load_animation("iso_prince_hero_attack", 1),   # <- nowy sprite
+            "idle":   list(scaled_animation("iso_prince_hero",        3, 0.5)),
+            "run":    list(scaled_animation("iso_prince_hero_run",    3, 0.5)),
+            "climb":  list(scaled_animation("iso_prince_hero_climb",  1, 0.5)),
+            "crouch": list(scaled_animation("iso_prince_crouch",      1, 0.5)),
+            "attack": list(scaled_animation("iso_prince_hero_attack", 1, 0.5)),   # <- nowy sprite
         }
-
-        # skalowanie 128×128 → 64×64
-        for state, frames in animations.items():
-            animations[state] = [
-                pygame.transform.scale(
-                    f, (f.get_width() // 2, f.get_height() // 2)
-                )
-                for f in frames
-            ]
         super().__init__(pos, groups, animations, anim_interval=0.15)
 
+        self._base_image = self.image      # bieżąca klatka bez migania (warianty: blink_frames)
+
         # pozycja i ruch
         self.pos   = pygame.math.Vector2(self.rect.topleft)
         self.vel   = pygame.math.Vector2(0, 0)
@@ -69,11 +87,16 @@ class Player(BaseEntity):
         # kierunek patrzenia (start – w prawo)
         self.facing = pygame.math.Vector2(1, 0)
 
+    @property
+    def mask(self) -> pygame.mask.Mask:
+        """Kolizje liczymy z klatki bazowej, nie z wariantu migania."""
+        return frame_mask(self._base_image)
+
     def handle_input(self):
         if self.falling_off:
             return
 
-        keys = pygame.key.get_pressed()
+        keys = self.keys()
         dx = dy = 0
 
         # ruch
@@ -169,10 +192,12 @@ class Player(BaseEntity):
             self.pos += self.vel * dt
             self.rect.topleft = (int(self.pos.x), int(self.pos.y))
 
-        # 3) zwykła animacja klatek (BaseEntity)
+        # 3) zwykła animacja klatek (BaseEntity) – na klatce bazowej
+        self.image = self._base_image
         super().update(dt)
+        self._base_image = self.image
 
-        # 4) nieczułość + miganie — nie dotykamy oryginalnych klatek!
+        # 4) nieczułość + miganie – gotowe warianty, bez kopiowania klatek
         if self.invul_timer > 0:
             self.invul_timer -= dt
             self._blink_timer += dt
@@ -180,11 +205,6 @@ class Player(BaseEntity):
                 self._blink_timer = 0.0
                 self._blink_state = not self._blink_state
 
-            # kopiujemy bieżącą klatkę, aby nie psuć tej z cache
-            self.image = self.image.copy()
-            self.image.set_alpha(128 if self._blink_state else 0)
+            self.image = blink_frames(self.image)[1 if self._blink_state else 2]
         else:
-            self._blink_state = True  # widoczny
-            # upewnij się, że klatka jest w 100 % widoczna
-            self.image = self.image.copy()
-            self.image.set_alpha(255)
+            self._blink_state = True  # widoczny, oryginalna klatka
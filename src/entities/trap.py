@@ -1,10 +1,11 @@
 # src/entities/trap.py
 
-import pygame
 from ..utils.loader import load_animation
 from .base import BaseEntity
 
 class SpikeTrap(BaseEntity):
+    SLEEP_STATE = BaseEntity.SLEEP_STATE + ("timer", "damage_enabled")
+
     def __init__(self, pos, groups):
         # 3 klatki: 0=zamknięte, 1=otwieranie, 2=otwarte
         animations = {
@@ -21,13 +22,14 @@ class SpikeTrap(BaseEntity):
         # co sekundę przechodzimy do kolejnej klatki
         idx = int(self.timer // 1.0)  # 0,1 lub 2
         self.frame_index = idx
-        # odśwież obraz i maskę
+        # odśwież obraz (maska z cache, gdy będzie potrzebna)
         self.image = self.animations["idle"][self.frame_index]
-        self.mask  = pygame.mask.from_surface(self.image)
         # w pełni otwarte (idx==2) -> damage on
         self.damage_enabled = (idx == 2)
 
 class FloorCollapse(BaseEntity):
+    SLEEP_STATE = BaseEntity.SLEEP_STATE + ("triggered",)
+
     def __init__(self, pos, groups):
         animations = {
             "idle": load_animation("iso_floor_collapse", 2)
@@ -43,7 +45,6 @@ class FloorCollapse(BaseEntity):
             # klatka „upadek”
             self.frame_index = 1
             self.image = self.animations["idle"][1]
-            self.mask  = pygame.mask.from_surface(self.image)
         super().update(dt)
 
 class BladeSpinner(BaseEntity):
@@ -60,5 +61,4 @@ class BladeSpinner(BaseEntity):
         self.frame_index = (self.frame_index + self.SPIN_FPS * dt) % 4
         idx = int(self.frame_index)
         self.image = self.animations["idle"][idx]
-        self.mask  = pygame.mask.from_surface(self.image)
         super().update(dt)
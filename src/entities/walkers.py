@@ -0,0 +1,361 @@
+# src/entities/walkers.py
+"""
+Wsadowa aktualizacja wrogów chodzących po kaflach (Bandit, Skeleton).
+
+Stan AI trzymamy w tablicach NumPy (struktura tablic): pozycje, kierunki
+izometryczne, timery zmiany kierunku, cooldown ciosu i HP. Dystans do gracza,
+wybór kierunku w pościgu (krok z pola przepływu poziomu), prędkość izo
+i trzy próbki stopy liczymy dla wszystkich naraz; sprite'y dostają potem
+tylko pozycję, rect i animację.
+
+Zasady są te same co w `Bandit.update` / `Skeleton.update`. Losowania
+(zmiana kierunku w patrolu, odbicie od krawędzi) idą przez metody sprite'a,
+ze strumienia poziomu (`spr.rng`), w kolejności sprite'ów.
+
+Pola `dir_iso`, `turn_t`, `atk_t` i `hp` sprite'a we wsadzie to deskryptory
+`Batched` – czytają i piszą wprost wiersz tablic, więc nic nie widzi
+nieaktualnych wartości (np. cios miecza w Level.update zmienia `hp` w tablicy).
+Pozycję sprite dostaje po każdym ticku razem z rect.
+
+NumPy jest opcjonalne – bez niego (albo gdy wrogów jest mniej niż
+BATCH_WALKERS_MIN) `make_walker_system()` zwraca None i wrogowie
+aktualizują się po staremu, każdy osobno.
+
+Z `lod=True` dalecy wrogowie dostają tick rzadziej (te same progi co
+AIScheduler w src/levels/lod.py), z dt zebranym od poprzedniego ticku.
+"""
+from __future__ import annotations
+
+try:
+    import numpy as np
+except ImportError:                                 # opcjonalna zależność
+    np = None
+
+import pygame
+
+from ..core.settings import (BATCH_WALKERS, BATCH_WALKERS_MIN,
+                             AI_LOD_TIERS, AI_LOD_FAR, AI_LOD_VIEW_MARGIN)
+from ..levels.walkgrid import SPX, SPY, PW, PH
+from ..levels.flowfield import HERE, STEER_DEAD
+
+_FOOT = (0.25, 0.50, 0.75)                          # próbki stopy (ułamek szerokości)
+_FIELDS = ("dir_iso", "turn_t", "atk_t", "hp")      # pola sprite'a trzymane w tablicach
+
+
+class Batched:
+    """
+    Pole sprite'a, które we wsadzie żyje w kolumnie tablic WalkerSystem
+    (wiersz w `spr._row`); poza wsadem – zwykły atrybut instancji.
+    """
+    def __init__(self, column: str, cast=float):
+        self.column = column
+        self.cast   = cast
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, spr, owner=None):
+        if spr is None:
+            return self
+        row = spr.__dict__.get("_row")
+        if row is None:
+            try:
+                return spr.__dict__[self.name]
+            except KeyError:
+                raise AttributeError(self.name) from None
+        system, i = row
+        return self.cast(getattr(system, self.column)[i])
+
+    def __set__(self, spr, value):
+        row = spr.__dict__.get("_row")
+        if row is None:
+            spr.__dict__[self.name] = value
+        else:
+            system, i = row
+            getattr(system, self.column)[i] = value
+
+
+def vec2(a) -> pygame.math.Vector2:
+    return pygame.math.Vector2(float(a[0]), float(a[1]))
+
+
+def make_walker_system(count: int, lod: bool = False) -> "WalkerSystem | None":
+    """System dla mapy z `count` wrogami chodzącymi albo None (aktualizacja per sprite)."""
+    if np is None or not BATCH_WALKERS or count < BATCH_WALKERS_MIN:
+        return None
+    return WalkerSystem(lod)
+
+
+class WalkerSystem:
+    def __init__(self, lod: bool = False):
+        self.lod   = lod                            # tick co N klatek dla dalekich (src/levels/lod.py)
+        self.frame = 0
+        self.sprites: list = []
+        self._slot:    dict = {}                    # sprite → wiersz tablic
+        self._added:   list = []
+        self._removed: set  = set()
+        self._grid  = None                          # siatka chodliwości z ramką (spłaszczona, kształt, ramka, zasięg)
+        self._cover = None                          # pokrycie płytkami (WalkGrid.cover) jako uint8
+        self._walk  = None
+        self._flow  = None                          # widoki tablic pola przepływu
+        self._alloc(0)
+
+    def _alloc(self, n: int) -> None:
+        self.pos    = np.zeros((n, 2))
+        self.dir    = np.zeros((n, 2))
+        self.turn_t = np.zeros(n)
+        self.atk_t  = np.zeros(n)
+        self.hp     = np.zeros(n, dtype=np.int64)
+        self.acc    = np.zeros(n)                   # LOD: dt zebrane od ostatniego ticku
+        # parametry z klasy sprite'a
+        self.detect   = np.zeros(n)
+        self.melee    = np.zeros(n)
+        self.spd_pat  = np.zeros(n)
+        self.spd_chs  = np.zeros(n)
+        self.norm     = np.zeros(n)
+        self.size     = np.zeros((n, 2))
+
+    # ────────────────────────────────────────────────────────────
+    def add(self, spr) -> None:
+        if spr in self._removed:                    # zdjęty w tej samej klatce – wiersz wciąż jest
+            self._removed.discard(spr)
+            self._bind(spr, self._slot[spr])
+        elif not spr.batched:
+            self._added.append(spr)
+        spr.batched = True
+
+    def remove(self, spr) -> None:
+        """Zdejmuje sprite z systemu i oddaje mu stan (np. przed uśpieniem)."""
+        if spr in self._added:
+            self._added.remove(spr)
+        elif spr.batched:
+            self._unbind(spr)
+            self._removed.add(spr)
+        spr.batched = False
+
+    def __len__(self) -> int:
+        return len(self.sprites) + len(self._added) - len(self._removed)
+
+    def _bind(self, spr, i: int) -> None:
+        """Pola `_FIELDS` sprite'a przechodzą do wiersza `i` tablic."""
+        vals = [getattr(spr, k) for k in _FIELDS]
+        spr._row = (self, i)
+        for k, v in zip(_FIELDS, vals):
+            setattr(spr, k, v)
+
+    def _unbind(self, spr) -> None:
+        """Oddaje sprite'owi jego wiersz (pozycję i `_FIELDS`) jako zwykłe atrybuty."""
+        i = self._slot[spr]
+        spr.pos.update(*self.pos[i])
+        vals = [getattr(spr, k) for k in _FIELDS]
+        spr._row = None
+        for k, v in zip(_FIELDS, vals):
+            setattr(spr, k, v)
+
+    def _sync(self) -> None:
+        """Wyrzuca zabite / zdjęte sprite'y i dopisuje nowe – raz na klatkę."""
+        keep = [i for i, s in enumerate(self.sprites) if s.alive() and s not in self._removed]
+        if len(keep) == len(self.sprites) and not self._added:
+            return
+        for spr in self.sprites:
+            if spr._row is not None and not spr.alive():
+                self._unbind(spr)                   # zabity – stan zostaje na sprite'cie
+        n_old = len(keep)
+        arrays = {k: getattr(self, k)[keep] for k in
+                  ("pos", "dir", "turn_t", "atk_t", "hp", "acc", "detect", "melee",
+                   "spd_pat", "spd_chs", "norm", "size")}
+        sprites = [self.sprites[i] for i in keep] + self._added
+
+        self._alloc(len(sprites))
+        for k, arr in arrays.items():
+            getattr(self, k)[:n_old] = arr
+        for i, spr in enumerate(sprites[:n_old]):
+            spr._row = (self, i)
+        for i, spr in enumerate(self._added, n_old):
+            self.pos[i] = spr.pos
+            self._bind(spr, i)
+            self.detect[i]  = spr.DETECT_RADIUS
+            self.melee[i]   = spr.MELEE_RANGE
+            self.spd_pat[i] = spr.SPD_PATROL
+            self.spd_chs[i] = spr.SPD_CHASE
+            self.norm[i]    = spr.NORM
+            self.size[i]    = spr.rect.size
+        self.sprites = sprites
+        self._slot = {spr: i for i, spr in enumerate(sprites)}
+        self._added = []
+        self._removed.clear()
+
+    @staticmethod
+    def _tile_coords(walk, xs, ys):
+        """Odwrotny rzut izo bez zaokrąglenia – ułamkowe (x, y) kafla."""
+        u = (xs - walk.cx) / SPX
+        v = (ys - walk.cy) / SPY
+        return (v + u) * 0.5, (v - u) * 0.5
+
+    def _walkable(self, walk, xs, ys):
+        """Wektorowa wersja WalkGrid.walkable (piksel płytki, nie sam romb)."""
+        if walk is not self._walk:
+            # siatka z ramką: punkt spoza mapy przycinamy na ramkę, a ramka jest na
+            # tyle szeroka, że żadne przesunięcie z `offsets` nie wróci z niej do mapy
+            r = max((max(abs(dx), abs(dy)) for dx, dy in walk.offsets), default=0)
+            pad = 2 * r + 1
+            grid = np.zeros((walk.rows + 2 * pad, walk.cols + 2 * pad), dtype=bool)
+            grid[pad:pad + walk.rows, pad:pad + walk.cols] = \
+                np.frombuffer(walk.cells, dtype=np.uint8).reshape(walk.rows, walk.cols) == 1
+            self._walk  = walk
+            self._grid  = (grid.ravel(), grid.shape, pad, r)
+            self._cover = np.frombuffer(walk.cover, dtype=np.uint8)
+            self._delta = np.array([dy * grid.shape[1] + dx for dx, dy in walk.offsets], dtype=np.intp)
+            self._bit   = (1 << np.arange(len(walk.offsets))).astype(np.uint8)
+        cells, (gh, gw), pad, r = self._grid
+        i, lx = np.divmod(np.floor(xs).astype(np.intp) - walk.ox, PW)
+        j, ly = np.divmod(np.floor(ys).astype(np.intp) - walk.oy, PH)
+        tx = np.clip(i + j + pad, r, gw - 1 - r)
+        ty = np.clip(j - i + pad, r, gh - 1 - r)
+        # wszystkie kafle z `offsets` naraz: (n, K) – podłoga i płytka nad pikselem
+        ground = cells[(ty * gw + tx)[:, None] + self._delta]
+        plate  = (self._cover[ly * PW + lx][:, None] & self._bit) != 0
+        return (ground & plate).any(axis=1)
+
+    def _flow_steps(self, flow, pos, size):
+        """Wektorowa wersja FlowField.step_at → (kierunki (n, 2), czy jest droga)."""
+        if flow is not self._flow:
+            self._flow  = flow
+            self._seen  = np.frombuffer(flow.seen, dtype=np.uint32)
+            self._steps = np.frombuffer(flow.steps, dtype=np.uint8)
+        walk = flow.walk
+        fx, fy = self._tile_coords(walk, pos[:, 0] + size[:, 0] * 0.5, pos[:, 1] + size[:, 1] - 2)
+        tx, ty = np.floor(fx + 0.5), np.floor(fy + 0.5)
+        inside = (tx >= 0) & (tx < walk.cols) & (ty >= 0) & (ty < walk.rows)
+        idx = np.where(inside, ty * walk.cols + tx, 0).astype(np.intp)
+        code = self._steps[idx].astype(np.intp)
+        has = inside & (self._seen[idx] == flow.gen) & (code != HERE)
+
+        sx, sy = code // 3 - 1, code % 3 - 1
+        ox, oy = fx - tx, fy - ty
+        off = np.abs(ox * sy - oy * sx) > STEER_DEAD * np.hypot(sx, sy)
+        steps = np.stack((np.where(off, -np.sign(ox), sx), np.where(off, -np.sign(oy), sy)), axis=1)
+        return steps.astype(float), has
+
+    def _feet_ok(self, walk, nxt, size):
+        """Wszystkie próbki stopy jednym zapytaniem – (n,) True, gdy każda stoi na podłodze."""
+        xs = np.trunc(np.concatenate([nxt[:, 0] + size[:, 0] * f for f in _FOOT]))
+        ys = np.tile(np.trunc(nxt[:, 1] + size[:, 1] - 2), len(_FOOT))
+        return self._walkable(walk, xs, ys).reshape(len(_FOOT), -1).all(axis=0)
+
+    @staticmethod
+    def _step_one(walk, pos, d, size, k: float, dt: float):
+        """Ten sam krok co wektorowo, dla jednego wroga (po zmianie kierunku)."""
+        (x, y), (dx, dy), (w, h) = pos.tolist(), d.tolist(), size.tolist()
+        nx = x + (dx - dy) * SPX * k * dt
+        ny = y + (dx + dy) * SPY * k * dt
+        foot_y = int(ny + h - 2)
+        return (nx, ny), all(walk.walkable_many([(int(nx + w * f), foot_y) for f in _FOOT]))
+
+    def _schedule(self, dt: float, level, dist):
+        """LOD: którzy wrogowie dostają tick w tej klatce i z jakim (zebranym) dt."""
+        self.acc += dt
+        view = level.viewport().inflate(2 * AI_LOD_VIEW_MARGIN, 2 * AI_LOD_VIEW_MARGIN)
+        x, y = self.pos[:, 0], self.pos[:, 1]
+        w, h = self.size[:, 0], self.size[:, 1]
+        on_screen = (x + w > view.left) & (x < view.right) & (y + h > view.top) & (y < view.bottom)
+
+        period = np.full(len(dist), AI_LOD_FAR)
+        for radius, p in reversed(AI_LOD_TIERS):        # bliższy poziom nadpisuje dalszy
+            period[dist <= radius] = p
+        period[on_screen] = 1
+        # przesunięcie fazy wg numeru wiersza – dalecy rozkładają się po klatkach
+        tick = (self.frame + np.arange(len(dist))) % period == 0
+        self.frame += 1
+
+        idx = np.flatnonzero(tick)
+        dts = self.acc[idx]
+        self.acc[idx] = 0.0
+        return idx, dts
+
+    # ────────────────────────────────────────────────────────────
+    def update(self, dt: float, level) -> None:
+        self._sync()
+        n = len(self.sprites)
+        walk = getattr(level, "walk", None)
+        if not n or walk is None:
+            return
+
+        # ── dystans do gracza / pościg ────────────────────
+        player = getattr(level.game, "player", None)
+        if player is not None:
+            vec = np.asarray(player.rect.center, dtype=float) - self.pos
+            dist = np.sqrt(vec[:, 0] * vec[:, 0] + vec[:, 1] * vec[:, 1])
+        else:
+            vec = np.zeros((n, 2))
+            dist = np.full(n, 1e9)
+
+        if self.lod:
+            idx, dts = self._schedule(dt, level, dist)
+            if not len(idx):
+                return
+            vec, dist = vec[idx], dist[idx]
+        else:
+            idx, dts = np.arange(n), np.full(n, dt)
+
+        pos, dirs = self.pos[idx], self.dir[idx]
+        turn_t, atk_t = self.turn_t[idx], self.atk_t[idx]
+        size = self.size[idx]
+        chasing = dist <= self.detect[idx]
+
+        ax, ay = np.abs(vec[:, 0]), np.abs(vec[:, 1])
+        chase_dir = np.stack((np.where(ax > ay, np.copysign(1.0, vec[:, 0]), 0.0),
+                              np.where(ay >= ax, np.copysign(1.0, vec[:, 1]), 0.0)), axis=1)
+        turn = chasing & ((ax > 0) | (ay > 0))
+        flow = getattr(level, "flow", None)
+        if flow is not None and chasing.any():
+            steps, has = self._flow_steps(flow, pos, size)
+            chase_dir[has] = steps[has]
+            turn |= chasing & has
+        dirs[turn] = chase_dir[turn]
+        speed = np.where(chasing, self.spd_chs[idx], self.spd_pat[idx])
+
+        patrol = ~chasing
+        turn_t[patrol] -= dts[patrol]
+        expired = patrol & (turn_t <= 0)
+
+        # ── próba ruchu (wszyscy naraz) ───────────────────
+        k = (speed * self.norm[idx])[:, None]
+        vel = np.stack(((dirs[:, 0] - dirs[:, 1]) * SPX, (dirs[:, 0] + dirs[:, 1]) * SPY), axis=1) * k
+        nxt = pos + vel * dts[:, None]
+        ok = self._feet_ok(walk, nxt, size)
+
+        # losowania w kolejności sprite'ów: najpierw zmiana kierunku w patrolu
+        # (wtedy krok liczymy jeszcze raz, skalarnie), potem odbicie od krawędzi
+        for j in np.flatnonzero(expired | ~ok):
+            spr = self.sprites[idx[j]]
+            if expired[j]:
+                spr._pick_new_dir()
+                dirs[j] = spr.dir_iso
+                turn_t[j] = spr.rng.uniform(*spr.TURN_DELAY)
+                nxt[j], ok[j] = self._step_one(walk, pos[j], dirs[j], size[j], float(k[j, 0]), dts[j])
+            if not ok[j]:
+                spr._pick_new_dir()
+                dirs[j] = spr.dir_iso
+        pos[ok] = nxt[ok]
+
+        # ── walka wręcz ───────────────────────────────────
+        hits = chasing & (dist <= self.melee[idx]) & (atk_t <= 0)
+        for j in np.flatnonzero(hits):
+            spr = self.sprites[idx[j]]
+            if hasattr(level, "_apply_damage"):
+                level._apply_damage(spr.DMG)
+            atk_t[j] = spr.ATK_COOLDOWN
+        np.maximum(atk_t - dts, 0.0, out=atk_t)
+
+        self.pos[idx], self.dir[idx] = pos, dirs
+        self.turn_t[idx], self.atk_t[idx] = turn_t, atk_t
+
+        # ── sprite'y: pozycja, rect, animacja ─────────────
+        sprites = self.sprites
+        for i, (x, y), d in zip(idx.tolist(), pos.tolist(), dts.tolist()):
+            spr = sprites[i]
+            spr.pos.update(x, y)
+            spr.state = "run"
+            spr.rect.topleft = (int(x), int(y))
+            spr.animate(d)
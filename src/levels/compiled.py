@@ -0,0 +1,154 @@
+# src/levels/compiled.py
+"""
+Skompilowane mapy ASCII – cache/levels/<mapa>.lvl.
+
+Artefakt trzyma wszystko, co Level liczył dotąd przy każdym starcie:
+listę kafli (x, y, wx, wy, znak) ze współrzędnymi iso, listę spawnów,
+world_rect i siatkę chodliwości (WalkGrid, z pokryciem masek płytek). Klucz to hash treści mapy,
+plików kafli podłogi i parametrów układu – zmiana któregokolwiek
+unieważnia artefakt, a `load()` kompiluje go od nowa przy następnym starcie.
+
+Samej podłogi nie pieczemy do pliku: FloorLayer rysuje chunki leniwie
+z listy kafli.
+
+Kompilacja wszystkich map (równolegle, w osobnych procesach):
+
+    python -m src.levels.compiled
+"""
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+
+import pygame
+
+from ..core.settings import TILE, WIDTH, IMG_DIR, LVL_DIR, LEVEL_CACHE_DIR
+from .walkgrid import WalkGrid
+
+FORMAT = 3
+PLATES = ("iso_block/iso_plate_1.png", "iso_block/iso_plate_2.png")
+ORIGIN = (-260, -210)                 # przesunięcie mapy (offset_x, offset_y)
+SPAWNS = "PGbSBL^XO"                  # znaki, które coś tworzą (reszta to sama podłoga)
+
+
+class CompiledLevel:
+    def __init__(self, tiles: list[tuple[int, int, int, int, str]],
+                 world_rect: pygame.Rect, walk: WalkGrid):
+        self.tiles      = tiles
+        self.spawns     = [t for t in tiles if t[4] in SPAWNS]
+        self.world_rect = world_rect
+        self.walk       = walk        # tylko do odczytu – wspólna dla restartów
+
+
+# ────────────────────────────────────────────────────────────────
+# KOMPILACJA
+
+def _key(text: str) -> str:
+    h = hashlib.sha1(f"{FORMAT}|{TILE}|{WIDTH}|{ORIGIN}".encode())
+    h.update(text.encode())
+    for name in PLATES:
+        h.update((IMG_DIR / name).read_bytes())
+    return h.hexdigest()
+
+
+def parse(text: str, plate_size: tuple[int, int]) -> tuple[list, pygame.Rect]:
+    """Kafle mapy we współrzędnych świata i prostokąt całego świata."""
+    spx, spy = TILE // 3, TILE // 6
+    ox, oy = ORIGIN
+    tiles = []
+    for y, row in enumerate(text.splitlines()):
+        for x, ch in enumerate(row):
+            if ch == "#":
+                continue
+            wx = (x - y) * spx + WIDTH // 2 + ox
+            wy = (x + y) * spy + 100 + oy
+            tiles.append((x, y, wx, wy, ch))
+
+    pw, ph = plate_size
+    left   = min(t[2] for t in tiles)
+    right  = max(t[2] + pw for t in tiles)
+    top    = min(t[3] for t in tiles)
+    bottom = max(t[3] + ph for t in tiles)
+    return tiles, pygame.Rect(left, top, right - left, bottom - top)
+
+
+def _cache_path(filename: str) -> Path:
+    return LEVEL_CACHE_DIR / f"{Path(filename).stem}.lvl"
+
+
+def compile_map(filename: str) -> dict:
+    """Kompiluje jedną mapę i zapisuje artefakt; działa bez okna (także w procesie roboczym)."""
+    text = (LVL_DIR / filename).read_text()
+    # bez convert_alpha – piksele są te same, a proces roboczy nie ma ekranu
+    plates = [pygame.image.load(IMG_DIR / name) for name in PLATES]
+    tiles, world_rect = parse(text, plates[0].get_size())
+
+    # środek rombu kafla (0, 0) = jego lewy górny róg + środek nieprzezroczystej płytki;
+    # chodliwość z masek alfa płytek (jak dawna maska pikselowa całej podłogi)
+    masks = [pygame.mask.from_surface(p) for p in plates]
+    ax, ay = masks[0].centroid()
+    origin = (WIDTH // 2 + ORIGIN[0], 100 + ORIGIN[1])
+    walk = WalkGrid.from_tiles(tiles, (origin[0] + ax, origin[1] + ay), origin, masks)
+
+    art = {
+        "format":     FORMAT,
+        "key":        _key(text),
+        "tiles":      tiles,
+        "world_rect": tuple(world_rect),
+        "walk":       (walk.cols, walk.rows, walk.cells, (walk.cx, walk.cy),
+                       (walk.ox, walk.oy), walk.offsets, walk.cover),
+    }
+    path = _cache_path(filename)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_bytes(pickle.dumps(art, pickle.HIGHEST_PROTOCOL))
+        os.replace(tmp, path)                       # atomowo – równoległe kompilacje
+    except OSError:
+        pass                                        # cache tylko przyspiesza
+    return art
+
+
+def _read(filename: str, key: str) -> dict | None:
+    try:
+        art = pickle.loads(_cache_path(filename).read_bytes())
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError):
+        return None
+    if not isinstance(art, dict) or art.get("format") != FORMAT or art.get("key") != key:
+        return None                                 # mapa / kafle zmienione → przelicz
+    return art
+
+
+# ────────────────────────────────────────────────────────────────
+# ODCZYT (używany przez Level)
+
+def load(filename: str) -> CompiledLevel:
+    """
+    Skompilowana mapa z cache/levels/ (kompiluje przy braku lub zmianie).
+    Wynik zostaje w pamięci pod hashem treści – restart niezmienionej mapy
+    nie czyta artefaktu, a zmieniona w trakcie gry mapa kompiluje się od nowa.
+    """
+    return _load(filename, _key((LVL_DIR / filename).read_text()))
+
+
+@lru_cache(maxsize=8)
+def _load(filename: str, key: str) -> CompiledLevel:
+    art = _read(filename, key) or compile_map(filename)
+    return CompiledLevel(art["tiles"], pygame.Rect(art["world_rect"]), WalkGrid(*art["walk"]))
+
+
+def compile_all(workers: int | None = None) -> list[str]:
+    """Kompiluje wszystkie assets/levels/level*.txt równolegle; zwraca nazwy map."""
+    names = sorted(p.name for p in LVL_DIR.glob("level*.txt"))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        list(pool.map(compile_map, names))
+    return names
+
+
+if __name__ == "__main__":
+    done = compile_all()
+    print(f"levels: {len(done)} map skompilowanych → {LEVEL_CACHE_DIR}")
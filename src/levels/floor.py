@@ -0,0 +1,91 @@
+# src/levels/floor.py
+"""
+Warstwa podłogi dzielona na kawałki (chunki) renderowane leniwie.
+
+Zamiast jednej powierzchni wielkości całej mapy trzymamy tylko listę
+kafli; chunk FLOOR_CHUNK×FLOOR_CHUNK jest rysowany przy pierwszym wejściu
+w kadr i trafia do cache LRU z budżetem bajtów FLOOR_CACHE_BYTES.
+Zużycie pamięci zależy więc od rozmiaru okna, a nie od rozmiaru mapy.
+"""
+from __future__ import annotations
+
+from collections import OrderedDict
+
+import pygame
+
+from ..core.settings import FLOOR_CHUNK, FLOOR_CACHE_BYTES
+
+
+class FloorLayer:
+    def __init__(self, world_rect: pygame.Rect,
+                 chunk: int = FLOOR_CHUNK,
+                 budget: int = FLOOR_CACHE_BYTES):
+        self.world_rect = world_rect
+        self.chunk  = chunk
+        self.budget = budget
+
+        # (cx, cy) → lista (surf, x, y) w lokalnych współrzędnych świata,
+        # w kolejności dodawania (zachowuje kolejność blitów)
+        self._tiles: dict[tuple[int, int], list[tuple[pygame.Surface, int, int]]] = {}
+        self._cache: OrderedDict[tuple[int, int], pygame.Surface] = OrderedDict()
+        self.cache_bytes = 0
+
+    # ────────────────────────────────────────────────────────────
+    def add_tile(self, surf: pygame.Surface, wx: int, wy: int) -> None:
+        """Rejestruje kafel (współrzędne świata) we wszystkich chunkach, które przecina."""
+        lx, ly = wx - self.world_rect.left, wy - self.world_rect.top
+        c = self.chunk
+        for cy in range(ly // c, (ly + surf.get_height() - 1) // c + 1):
+            for cx in range(lx // c, (lx + surf.get_width() - 1) // c + 1):
+                self._tiles.setdefault((cx, cy), []).append((surf, lx, ly))
+                self._drop((cx, cy))         # chunk trzeba przerysować
+
+    def invalidate(self) -> None:
+        self._cache.clear()
+        self.cache_bytes = 0
+
+    def _drop(self, key: tuple[int, int]) -> None:
+        surf = self._cache.pop(key, None)
+        if surf is not None:
+            self.cache_bytes -= surf.get_bytesize() * surf.get_width() * surf.get_height()
+
+    # ────────────────────────────────────────────────────────────
+    def _render(self, key: tuple[int, int]) -> pygame.Surface:
+        c = self.chunk
+        x0, y0 = key[0] * c, key[1] * c
+        surf = pygame.Surface((c, c), pygame.SRCALPHA)
+        for tile, lx, ly in self._tiles.get(key, ()):
+            surf.blit(tile, (lx - x0, ly - y0))
+        return surf
+
+    def _get(self, key: tuple[int, int]) -> pygame.Surface:
+        surf = self._cache.get(key)
+        if surf is not None:
+            self._cache.move_to_end(key)
+            return surf
+        surf = self._render(key)
+        self._cache[key] = surf
+        self.cache_bytes += surf.get_bytesize() * surf.get_width() * surf.get_height()
+        return surf
+
+    def _evict(self, keep: set[tuple[int, int]]) -> None:
+        """Wyrzuca najdawniej używane chunki, aż zmieścimy się w budżecie."""
+        while self.cache_bytes > self.budget and self._cache:
+            key = next(iter(self._cache))
+            if key in keep:                  # wszystko, co zostało, jest w kadrze
+                break
+            self._drop(key)
+
+    def draw(self, screen: pygame.Surface, view: pygame.Rect) -> None:
+        """Rysuje chunki pod kamerą; `view` – prostokąt okna we współrzędnych świata."""
+        c = self.chunk
+        lx0 = view.left - self.world_rect.left
+        ly0 = view.top  - self.world_rect.top
+        visible = set()
+        for cy in range(ly0 // c, (ly0 + view.height - 1) // c + 1):
+            for cx in range(lx0 // c, (lx0 + view.width - 1) // c + 1):
+                if (cx, cy) not in self._tiles:
+                    continue                 # pusty chunk – nic do rysowania
+                visible.add((cx, cy))
+                screen.blit(self._get((cx, cy)), (cx * c - lx0, cy * c - ly0))
+        self._evict(visible)
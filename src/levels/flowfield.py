@@ -0,0 +1,107 @@
+# src/levels/flowfield.py
+"""
+Pole przepływu (flow field) w stronę gracza, wspólne dla wszystkich ścigających.
+
+BFS po siatce chodliwości startuje z kafla gracza; każdy osiągnięty kafel
+dostaje krok (dx, dy) do sąsiada bliżej gracza. Kierunek izometryczny wroga
+(`dir_iso`) to właśnie krok w przestrzeni kafli, więc wróg tylko czyta
+gotowy krok spod stopy – O(1), bez własnego szukania ścieżki.
+
+Krok po skosie kafli trwa tyle samo co prosty (prędkość izo jest
+normalizowana), więc BFS z jednakowym kosztem daje najkrótsze ścieżki.
+Skosu nie wolno ciąć przez róg (oba sąsiednie kafle muszą być podłogą).
+
+Koszt jest ograniczony: BFS liczymy tylko do FLOW_RADIUS kroków od gracza
+i rozkładamy na klatki (najwyżej FLOW_BUDGET kafli na klatkę). Przebudowa
+startuje, gdy gracz zmieni kafel; stare wyniki unieważnia numer pokolenia,
+bez czyszczenia tablic.
+"""
+from __future__ import annotations
+
+from array import array
+from collections import deque
+from math import floor, hypot
+
+from ..core.settings import FLOW_RADIUS, FLOW_BUDGET
+from .walkgrid import WalkGrid, SPX, SPY
+
+HERE = 4                                # kod kroku (0, 0) – kafel gracza
+STEER_DEAD = 0.2                        # dopuszczalne zejście z osi kroku [kafle]
+_DIRS = ((1, 0), (-1, 0), (0, 1), (0, -1), (1, 1), (1, -1), (-1, 1), (-1, -1))
+
+
+class FlowField:
+    def __init__(self, walk: WalkGrid, radius: int = FLOW_RADIUS, budget: int = FLOW_BUDGET):
+        self.walk   = walk
+        self.radius = radius
+        self.budget = budget
+        n = walk.cols * walk.rows
+        self.seen  = array("I", bytes(4 * n))   # pokolenie, w którym kafel osiągnięto
+        self.dist  = array("H", bytes(2 * n))
+        self.steps = bytearray(n)               # kod kroku: (dx + 1) * 3 + (dy + 1)
+        self.gen    = 0
+        self.target: tuple[int, int] | None = None
+        self._queue: deque[int] = deque()
+
+    # ────────────────────────────────────────────────────────────
+    def update(self, target: tuple[int, int] | None) -> None:
+        """Wywoływane co klatkę z kaflem gracza; przebudowa tylko po zmianie kafla."""
+        if target != self.target:
+            self.target = target
+            self.gen += 1                       # unieważnia poprzednie pole
+            self._queue.clear()
+            tx, ty = target if target is not None else (-1, -1)
+            if self.walk.walkable_tile(tx, ty):
+                i = ty * self.walk.cols + tx
+                self.seen[i], self.dist[i], self.steps[i] = self.gen, 0, HERE
+                self._queue.append(i)
+        if self._queue:
+            self._expand(self.budget)
+
+    def _expand(self, budget: int) -> None:
+        cols, rows, cells = self.walk.cols, self.walk.rows, self.walk.cells
+        seen, dist, steps, gen = self.seen, self.dist, self.steps, self.gen
+        queue, radius = self._queue, self.radius
+        while queue and budget > 0:
+            budget -= 1
+            i = queue.popleft()
+            d = dist[i] + 1
+            if d > radius:
+                continue
+            x, y = i % cols, i // cols
+            for dx, dy in _DIRS:
+                nx, ny = x + dx, y + dy
+                if not (0 <= nx < cols and 0 <= ny < rows):
+                    continue
+                j = ny * cols + nx
+                if seen[j] == gen or not cells[j]:
+                    continue
+                if dx and dy and not (cells[y * cols + nx] and cells[ny * cols + x]):
+                    continue                    # skos przez róg
+                seen[j], dist[j] = gen, d
+                steps[j] = (1 - dx) * 3 + (1 - dy)   # krok z j z powrotem do i
+                queue.append(j)
+
+    # ────────────────────────────────────────────────────────────
+    def step_at(self, wx: float, wy: float) -> tuple[int, int] | None:
+        """
+        Kierunek izometryczny (dx, dy) w stronę gracza dla punktu świata; None – brak drogi.
+        Wróg zjechany z osi kroku najpierw wraca do środka swojego kafla – szeroka
+        stopa nie zahacza wtedy o narożnik przy przejściu do sąsiada.
+        """
+        walk = self.walk
+        u = (wx - walk.cx) / SPX
+        v = (wy - walk.cy) / SPY
+        fx, fy = (v + u) * 0.5, (v - u) * 0.5
+        tx, ty = floor(fx + 0.5), floor(fy + 0.5)
+        if not (0 <= tx < walk.cols and 0 <= ty < walk.rows):
+            return None
+        i = ty * walk.cols + tx
+        code = self.steps[i]
+        if self.seen[i] != self.gen or code == HERE:
+            return None
+        sx, sy = code // 3 - 1, code % 3 - 1
+        ox, oy = fx - tx, fy - ty
+        if abs(ox * sy - oy * sx) > STEER_DEAD * hypot(sx, sy):     # odległość od osi kroku
+            return (ox < 0) - (ox > 0), (oy < 0) - (oy > 0)
+        return sx, sy
@@ -1,9 +1,14 @@
 # src/levels/level.py
 
 import sys
+import random
+import zlib
+from contextlib import contextmanager
+from pathlib import Path
 import pygame
-from pygame.sprite import Group, spritecollide
-from ..core.settings import LVL_DIR, TILE, WIDTH, HEIGHT, ENEMY_POINTS, TIME_BONUS
+from pygame.sprite import Group, collide_mask
+from ..core.settings import (LVL_DIR, TILE, WIDTH, HEIGHT, ENEMY_POINTS, TIME_BONUS,
+                             SECTOR_SIZE, STREAM_MIN_SECTORS, AI_LOD_MIN_ENEMIES)
 from ..entities.player   import Player
 from ..entities.guard    import Guard
 from ..entities.bat      import Bat
@@ -11,16 +16,30 @@ from ..entities.skeleton import Skeleton
 from ..entities.bandit   import Bandit
 from ..entities.ladder   import Ladder
 from ..entities.trap     import SpikeTrap, FloorCollapse, BladeSpinner
+from ..entities.walkers  import make_walker_system
 from ..ui.hud            import HUD
-from ..utils.loader      import image
+from .spatial            import SpatialHash
+from .floor              import FloorLayer
+from .render_queue       import RenderQueue, BELOW, TRAPS, MAIN, LADDERS
+from .sectors            import SectorStreamer
+from .lod                import AIScheduler
+from .flowfield          import FlowField
+from .                   import compiled
+from ..utils.loader      import image, frame_mask
 from ..utils.save import add_score
 from ..core.settings import SND_GAME_OVER
 from ..utils.loader  import play
-from pathlib import Path          # ← DOPISZ  (musi być przed użyciem Path)
 
 
 
 
+def level_seed(session_seed, filename) -> int:
+    """Ziarno strumienia losowego poziomu: z ziarna sesji i nazwy mapy (None → z `random`)."""
+    if session_seed is None:
+        return random.getrandbits(32)
+    return zlib.crc32(f"{session_seed}:{Path(filename).name}".encode())
+
+
 class Level:
     def __init__(self, game, filename="level01.txt", next_level=None, prev_hp=None):
         import pygame, random, math
@@ -30,8 +49,13 @@ class Level:
         self.COLLAPSE_DMG = 15
 
         self.game = game
+        self.prof = game.profiler            # profiler klatki (src/core/profiler.py)
+        self.prof.context = filename
         self.filename = filename
         self.next_lvl = next_level
+        # losowość AI (patrol, nietoperze) tylko z tego strumienia – przy danym
+        # ziarnie sesji nagrane wejście odtwarza poziom co do bitu (src/core/replay.py)
+        self.rng = random.Random(level_seed(game.seed, filename))
 
         self.hud = HUD(game)
         self.world = pygame.sprite.Group()
@@ -46,82 +70,159 @@ class Level:
         self._enemies_alive = 0
 
         # ─── przesunięcia i kamera ──────────────────────────────
-        self.offset_x, self.offset_y = -260, -210
+        self.offset_x, self.offset_y = compiled.ORIGIN
         self.camera = pygame.math.Vector2(0, 0)
         self.SCROLL_X = WIDTH // 4
         self.SCROLL_Y = HEIGHT // 4
 
         # ─── tło (statyczne, pełny ekran) ───────────────────────
         try:
-            self.bg = image("bgn/bgn.png")
+            self.bg = image("bgn/bgn.png", opaque=True)   # zwykła kopia, bez alfy
         except pygame.error:
             self.bg = pygame.Surface((WIDTH, HEIGHT))
             self.bg.fill((30, 10, 0))
 
-        # ─── kafle podłogi i wczytanie mapy ASCII ───────────────
-        plates = [image("iso_block/iso_plate_1.png"),
-                  image("iso_block/iso_plate_2.png")]
-        LVL_DIR = Path(__file__).parents[2] / "assets" / "levels"
-        lines = (LVL_DIR / filename).read_text().splitlines()
-        spx, spy = TILE // 3, TILE // 6
-
-        tmp_tiles = []
-        for y, row in enumerate(lines):
-            for x, ch in enumerate(row):
-                if ch == "#":
-                    continue
-                wx = (x - y) * spx + WIDTH // 2 + self.offset_x
-                wy = (x + y) * spy + 100 + self.offset_y
-                tmp_tiles.append((x, y, wx, wy, ch))
-
-        # granice całego świata (potrzebne kamerze + kolizji przepaści)
-        left = min(t[2] for t in tmp_tiles)
-        right = max(t[2] + plates[0].get_width() for t in tmp_tiles)
-        top = min(t[3] for t in tmp_tiles)
-        bottom = max(t[3] + plates[0].get_height() for t in tmp_tiles)
-        self.world_rect = pygame.Rect(left, top, right - left, bottom - top)
-
-        # powierzchnia podłogi = cała mapa
-        self.floor_surface = pygame.Surface(
-            (self.world_rect.width, self.world_rect.height), pygame.SRCALPHA
-        )
-        self.tile_positions = []
+        # ─── kafle podłogi i skompilowana mapa ASCII ────────────
+        plates = [image(name) for name in compiled.PLATES]
+        lvl = compiled.load(filename)
+        self.world_rect = lvl.world_rect.copy()
 
-        # ——— spawn obiektów ————————————————————————————————
-        for x, y, wx, wy, ch in tmp_tiles:
+        # podłoga = chunki renderowane leniwie przy pierwszym wejściu w kadr
+        self.floor = FloorLayer(self.world_rect)
+        self.tile_positions = []
+        for x, y, wx, wy, _ in lvl.tiles:
             surf = plates[(x + y) % 2]
-            self.floor_surface.blit(surf, (wx - left, wy - top))
+            self.floor.add_tile(surf, wx, wy)
             self.tile_positions.append(
                 pygame.Rect(wx, wy, surf.get_width(), surf.get_height())
             )
 
-            pos = (wx, wy)
+        # ——— spawn obiektów ————————————————————————————————
+        # duże mapy: encje (poza graczem) powstają dopiero przy kamerze
+        self._plates = plates
+        self.trap_tiles: dict[tuple[int, int], pygame.sprite.Sprite] = {}   # (x, y) kafla → pułapka
+        n_sectors = ((self.world_rect.width  - 1) // SECTOR_SIZE + 1) * \
+                    ((self.world_rect.height - 1) // SECTOR_SIZE + 1)
+        self.streamer = None
+        if n_sectors >= STREAM_MIN_SECTORS:
+            self.streamer = SectorStreamer(self.world_rect,
+                                           [s for s in lvl.spawns if s[4] != "P"])
+
+        for x, y, wx, wy, ch in lvl.spawns:
             if ch == "P":
-                self.player = Player(pos, self.world)
+                self.player = Player((wx, wy), self.world, keys=self.game.keys)
                 if prev_hp is not None:
                     self.player.hp = max(0, min(prev_hp, self.player.max_hp))
-            elif ch == "G":
-                self.enemies.add(Guard(pos, self.world))
-            elif ch == "b":
-                self.enemies.add(Bat(pos, self.world, self.game))
-            elif ch == "S":
-                self.enemies.add(Skeleton(pos, self.world, self.game))
-            elif ch == "B":
-                self.enemies.add(Bandit(pos, self.world, self.game))
-            elif ch == "L":
-                Ladder(pos, self.world, self.ladders)
-            elif ch in "^XO":
-                trap_cls = {"^": SpikeTrap, "X": FloorCollapse, "O": BladeSpinner}[ch]
-                t = trap_cls(pos, self.world)
-                t.hit_rect = pygame.Rect(wx, wy, surf.get_width(), surf.get_height())
-                t.hit_mask = pygame.mask.from_surface(surf)
-                self.traps.add(t)
+            elif self.streamer is None:
+                self._spawn(x, y, wx, wy, ch)
 
         # ile wrogów żyje na starcie
         self._enemies_alive = len(self.enemies)
 
-        # maska podłogi (przepaść)
-        self.floor_mask = pygame.mask.from_surface(self.floor_surface)
+        # siatka chodliwości (przepaść) – z artefaktu, wspólna dla restartów
+        self.walk = lvl.walk
+        # pole przepływu do gracza – jedno dla wszystkich ścigających wrogów
+        self.flow = FlowField(self.walk)
+
+        # indeks przestrzenny do cullingu kamery; ruchome sprite'y
+        # (z atrybutem `pos`) przepinamy co klatkę, reszta stoi w miejscu
+        self.grid = SpatialHash(origin=self.world_rect.topleft)
+        # kolejka rysowania wg głębokości – przestawiamy tylko ruchome
+        self.render_queue = RenderQueue(self.traps, self.ladders)
+        for spr in self.world:
+            self.grid.insert(spr)
+            self.render_queue.add(spr)
+        # ruchome sprite'y w kolejności dodania (dict – usuwanie w O(1))
+        self._movers = {s: None for s in self.world if hasattr(s, "pos")}
+        # LOD AI na mapach gęstych od wrogów: dalecy dostają tick co N klatek
+        n_enemies = sum(1 for s in lvl.spawns if s[4] in "GbSB")
+        self.ai = AIScheduler() if n_enemies >= AI_LOD_MIN_ENEMIES else None
+        # Bandit / Skeleton liczone wsadowo (None – mało wrogów / brak numpy)
+        self.walkers = make_walker_system(sum(1 for s in lvl.spawns if s[4] in "BS"),
+                                          lod=self.ai is not None)
+        # sprite'y aktualizowane co klatkę przez grupę (bez LOD i bez wsadu)
+        self.always = pygame.sprite.Group()
+        for spr in self.world:
+            self._schedule(spr)
+        if self.streamer is not None:
+            self.streamer.update(self, self.viewport())
+
+        # tryb brudnych prostokątów: poprzednia klatka (sprite → obraz, rect)
+        self._dirty_prev = None
+        self._dirty_view = (0, 0)
+        self._hud_rects: list[pygame.Rect] = []
+
+        # stały krok (Game.run): pozycje sprzed ostatniego kroku do interpolacji
+        self._drawn: set = set()             # sprite'y z ostatniej klatki
+        self._interp_prev: dict = {}         # sprite → rect.topleft przed krokiem
+        self._interp_cam = None
+        self._alpha = 1.0                    # 1.0 → rysujemy stan bieżący
+        self.INTERP_MAX_JUMP = TILE          # dalszy skok (teleport) bez interpolacji
+
+    def _spawn(self, x, y, wx, wy, ch):
+        """Tworzy encję ze znaku mapy (bez gracza); zwraca sprite."""
+        pos = (wx, wy)
+        if ch == "G":
+            spr = Guard(pos, self.world)
+            self.enemies.add(spr)
+        elif ch == "b":
+            # na mapach strumieniowanych lata po całym świecie, inaczej po ekranie
+            bounds = self.world_rect if self.streamer is not None else None
+            spr = Bat(pos, self.world, self.game, self.rng, bounds)
+            self.enemies.add(spr)
+        elif ch == "S":
+            spr = Skeleton(pos, self.world, self.game, self.rng)
+            self.enemies.add(spr)
+        elif ch == "B":
+            spr = Bandit(pos, self.world, self.game, self.rng)
+            self.enemies.add(spr)
+        elif ch == "L":
+            spr = Ladder(pos, self.world, self.ladders)
+        else:  # "^XO"
+            surf = self._plates[(x + y) % 2]
+            trap_cls = {"^": SpikeTrap, "X": FloorCollapse, "O": BladeSpinner}[ch]
+            spr = trap_cls(pos, self.world)
+            spr.hit_rect = pygame.Rect(wx, wy, surf.get_width(), surf.get_height())
+            spr.hit_mask = frame_mask(surf)
+            self.traps.add(spr)
+            self.trap_tiles[(x, y)] = spr
+        spr.spawn = (x, y, wx, wy, ch)      # rekord do odtworzenia po uśpieniu sektora
+        return spr
+
+    def _schedule(self, spr):
+        """Kto aktualizuje sprite: WalkerSystem, AIScheduler (LOD) czy grupa `always`."""
+        if self.walkers is not None and isinstance(spr, (Bandit, Skeleton)):
+            self.walkers.add(spr)
+        elif self.ai is not None and spr in self.enemies:
+            self.ai.add(spr)
+        else:
+            self.always.add(spr)
+
+    def _attach(self, spr):
+        """Sprite (już w grupach) trafia do indeksu, kolejki rysowania i licznika wrogów."""
+        self.grid.insert(spr)
+        self.render_queue.add(spr)
+        if hasattr(spr, "pos"):
+            self._movers[spr] = None
+        self._schedule(spr)
+        if spr in self.enemies:
+            self._enemies_alive += 1
+
+    def _detach(self, spr):
+        """Odpina sprite ze wszystkich grup bez liczenia go jako zgonu."""
+        if spr in self.enemies:
+            self._enemies_alive -= 1
+        if self.walkers is not None and isinstance(spr, (Bandit, Skeleton)):
+            self.walkers.remove(spr)
+        if self.ai is not None:
+            self.ai.remove(spr)
+        spr.kill()
+        spawn = getattr(spr, "spawn", None)
+        if spawn is not None and self.trap_tiles.get(spawn[:2]) is spr:
+            del self.trap_tiles[spawn[:2]]
+        self.grid.remove(spr)
+        self.render_queue.remove(spr)
+        self._movers.pop(spr, None)
 
     def _calc_patrol_bounds(self, pos):
         same_row = [r for r in self.tile_positions if abs(r.y - pos[1]) < 1]
@@ -164,46 +265,50 @@ class Level:
         pass
 
     def update(self, dt):
-        # 0) aktualizacje sprite’ów
-        self.world.update(dt)
-
-        mw, mh = self.floor_mask.get_size()  # rozmiar maski
-
-        # 1) sprawdź, które obiekty tracą podłoże
-        for spr in self.world:
-            if not hasattr(spr, "pos") or isinstance(spr, Bat):
-                continue
-            if getattr(spr, "jumping", False) or getattr(spr, "falling_off", False):
-                continue
-
-            foot_world = (spr.rect.centerx, spr.rect.bottom - 1)
-            lx = foot_world[0] - self.world_rect.x
-            ly = foot_world[1] - self.world_rect.y
-
-            out = lx < 0 or lx >= mw or ly < 0 or ly >= mh
-            bad = False
-            if not out:
-                bad = self.floor_mask.get_at((lx, ly)) == 0
-
-            spr.falling_off = out or bad
-            if not spr.falling_off and hasattr(spr, "fall_vel"):
+        prof = self.prof                     # profiler klatki (F3) – fazy poniżej
+        prof.lap("other")
+        # 0) aktualizacje sprite’ów (+ wsadowo Bandit / Skeleton, + LOD dalekich wrogów);
+        #    pole przepływu przebudowuje się tylko po zmianie kafla gracza
+        self.flow.update(self.walk.tile_at(self.player.rect.centerx, self.player.rect.bottom - 1))
+        prof.lap("update.flow")
+        if prof.enabled:                     # koszt update osobno dla każdego typu encji
+            for spr in self.always.sprites():
+                spr.update(dt)
+                prof.lap_type(spr)
+        else:
+            self.always.update(dt)
+        if self.walkers is not None:
+            self.walkers.update(dt, self)
+            prof.lap("entity.walkers(batch)")
+        if self.ai is not None:
+            self.ai.update(dt, self)
+            prof.lap("entity.ai(lod)")
+        self._reindex()                      # siatka aktualna dla kolizji poniżej
+        prof.lap("update.reindex")
+
+        # 1) sprawdź, które obiekty tracą podłoże (jedno zapytanie do siatki)
+        grounded = [spr for spr in self.world
+                    if hasattr(spr, "pos") and not isinstance(spr, Bat)
+                    and not getattr(spr, "jumping", False)
+                    and not getattr(spr, "falling_off", False)]
+        feet = [(spr.rect.centerx, spr.rect.bottom - 1) for spr in grounded]
+        for spr, ok in zip(grounded, self.walk.walkable_many(feet)):
+            spr.falling_off = not ok
+            if ok and hasattr(spr, "fall_vel"):
                 spr.fall_vel = 0
+        prof.lap("update.ground")
 
         # 2) przegrana przy spadku gracza
         if self.player.falling_off and self.player.rect.top > HEIGHT + 200:
             self.game.game_over(False)
             return
 
-        # 3) PUŁAPKI (stopa gracza)
+        # 3) PUŁAPKI (stopa gracza) – kafel pod stopą → co najwyżej jedna pułapka
         foot_pt = (self.player.rect.centerx, self.player.rect.bottom - 2)
-        for trap in self.traps:
-            if not trap.hit_rect.collidepoint(foot_pt):
-                continue
-            lx = foot_pt[0] - trap.hit_rect.x
-            ly = foot_pt[1] - trap.hit_rect.y
-            if trap.hit_mask.get_at((lx, ly)) == 0:
-                continue
-
+        trap = self.trap_at(*foot_pt)
+        if trap is not None and trap.hit_rect.collidepoint(foot_pt) and \
+                trap.hit_mask.get_at((foot_pt[0] - trap.hit_rect.x,
+                                      foot_pt[1] - trap.hit_rect.y)):
             if isinstance(trap, SpikeTrap):
                 if trap.damage_enabled and self._apply_damage(self.SPIKE_DMG):
                     return
@@ -214,16 +319,22 @@ class Level:
             else:  # BladeSpinner
                 if self._apply_damage(self.BLADE_DMG):
                     return
+        prof.lap("update.traps")
 
-        # 4) wrogowie → gracz
-        if spritecollide(self.player, self.enemies, False, pygame.sprite.collide_mask):
+        # 4) wrogowie → gracz (kandydaci z siatki, maska tylko dla nich)
+        near = self._near(self.player.rect, self.enemies)
+        for bat in near:
+            if isinstance(bat, Bat) and bat.strike(self):
+                return
+        if any(collide_mask(self.player, e) for e in near):
             if self.player.invul_timer <= 0 and self._apply_damage(10):
                 return
+        prof.lap("update.contact")
 
         # 5) gracz → wrogowie (miecz)
         atk_box = self.player.attack_hitbox()
         if atk_box:
-            for e in list(self.enemies):
+            for e in self._near(atk_box, self.enemies):
                 if atk_box.colliderect(e.rect):
                     killed = False
                     if hasattr(e, "hp"):
@@ -235,6 +346,7 @@ class Level:
                     if killed:
                         e.kill()
                         self.score += ENEMY_POINTS
+        prof.lap("update.sword")
 
         # —►  PUNKTACJA za zgony środowiskowe ◄—
         alive_now = len(self.enemies)
@@ -243,12 +355,13 @@ class Level:
             self._enemies_alive = alive_now
 
         # 6) drabiny – wyjście z poziomu
-        if spritecollide(self.player, self.ladders, False, pygame.sprite.collide_mask):
+        if any(collide_mask(self.player, lad) for lad in self._near(self.player.rect, self.ladders)):
 
             # ----- zapis wyniku -----
             total = self.score
             lvl = f"level{self.game.level_index + 1}"
-            add_score(lvl, self.game.nick, total)
+            if self.game.save_scores:            # nie z odtwarzania / symulacji
+                add_score(lvl, self.game.nick, total)
 
             if self.next_lvl:  # przejście na kolejny poziom
                 self.camera.update(0, 0)
@@ -257,10 +370,16 @@ class Level:
             else:  # ostatni poziom
                 self.game.game_over(True)
             return
+        prof.lap("update.ladders")
 
         # 7) kamera (edge-scroll)
         self._edge_scroll_camera()
 
+        # 8) streaming sektorów (duże mapy)
+        if self.streamer is not None:
+            self.streamer.update(self, self.viewport())
+            prof.lap("update.stream")
+
     def _apply_damage(self, dmg: int) -> bool:
         """Zadaje obrażenia, uruchamia nieczułość.
            Zwraca True, gdy gracz zginął."""
@@ -276,35 +395,200 @@ class Level:
             return True
         return False
 
-    def draw(self, screen):
-        ox, oy = -int(self.camera.x), -int(self.camera.y)
+    def viewport(self) -> pygame.Rect:
+        """Prostokąt okna we współrzędnych świata (pozycja kamery)."""
+        return pygame.Rect(int(self.camera.x), int(self.camera.y), WIDTH, HEIGHT)
+
+    def _reindex(self) -> None:
+        """Przepina ruchome sprite'y w siatce (po ruchu) i sprząta zabite."""
+        dead = []
+        for spr in self._movers:
+            if spr.alive():
+                self.grid.update(spr)
+            else:
+                self.grid.remove(spr)
+                self.render_queue.remove(spr)
+                dead.append(spr)
+        for spr in dead:
+            del self._movers[spr]
+
+    def trap_at(self, wx: float, wy: float):
+        """Pułapka na kaflu pod punktem świata (albo None) – O(1), także dla wrogów."""
+        trap = self.trap_tiles.get(self.walk.tile_at(wx, wy))
+        return trap if trap is not None and trap.alive() else None
+
+    def _near(self, rect: pygame.Rect, group) -> list:
+        """Broad phase: sprite'y z `group`, których rect nachodzi na `rect` (z siatki)."""
+        return [spr for spr in self.grid.query(rect) if spr in group]
+
+    def _visible(self, view: pygame.Rect) -> set:
+        """
+        Culling – tylko sprite'y nachodzące na okno kamery (siatkę przepina
+        update). Klucze kolejki rysowania odświeżamy tylko ruchomym z nich.
+        """
+        queue = self.render_queue
+        visible = set()
+        for spr in self.grid.query(view):
+            if not spr.alive():
+                queue.remove(spr)            # zabity po przepięciu siatki w tym ticku
+                continue
+            if hasattr(spr, "pos"):
+                queue.update(spr)
+            visible.add(spr)
+        queue.show(visible)                  # kubełki kolejki = okno kamery
+        return visible
+
+    def _draw_scene(self, screen, view: pygame.Rect, only: set | None = None) -> None:
+        """Warstwy świata (bez HUD) – całe okno albo tylko sprite'y z `only`."""
+        ox, oy = -view.x, -view.y
+        layers = self.render_queue.layers(only)
+
+        prof = self.prof
 
         # 1) tło – nie przesuwamy
         screen.blit(self.bg, (0, 0))
+        prof.lap("draw.bg")
 
         # 2) spadające obiekty (rysuj przed podłogą)
-        below = [s for s in self.world if getattr(s, "falling_off", False)]
-        for spr in sorted(below, key=lambda s: s.rect.bottom):
+        for spr in layers[BELOW]:
             screen.blit(spr.image, spr.rect.move(ox, oy))
+        prof.lap("draw.below")
 
-        # 3) podłoga – cała mapa, przesunięcie = kamera + world_rect
-        screen.blit(self.floor_surface,
-                    (ox + self.world_rect.left, oy + self.world_rect.top))
-
+        # 3) podłoga – tylko chunki pod kamerą
+        self.floor.draw(screen, view)
+        prof.lap("draw.floor")
 
         # 4) pułapki
-        for trap in self.traps:
+        for trap in layers[TRAPS]:
             screen.blit(trap.image, trap.rect.move(ox, oy))
+        prof.lap("draw.traps")
 
-        # 5) reszta sprite’ów (bez pułapek i spadających) – sort wg Y
-        drawables = [s for s in self.world if s not in self.traps and s not in below]
-        for spr in sorted(drawables, key=lambda s: s.rect.bottom):
+        # 5) reszta sprite’ów (bez pułapek i spadających) – już posortowana wg Y
+        for spr in layers[MAIN]:
             screen.blit(spr.image, spr.rect.move(ox, oy))
+        prof.lap("draw.sprites")
 
         # 6) drabiny
-        for lad in self.ladders:
+        for lad in layers[LADDERS]:
             screen.blit(lad.image, lad.rect.move(ox, oy))
+        prof.lap("draw.ladders")
+
+    # ------------------------------------------------------------
+    def begin_step(self) -> None:
+        """Przed krokiem symulacji: zapamiętuje pozycje rysowanych sprite'ów i kamerę."""
+        self._interp_prev = {spr: spr.rect.topleft for spr in self._drawn}
+        self._interp_cam = (self.camera.x, self.camera.y)
+        self._alpha = 1.0
+
+    def interpolate(self, alpha: float) -> None:
+        """Ułamek kroku, jaki upłynął od ostatniej symulacji (0..1) – do rysowania."""
+        self._alpha = alpha
+
+    def _render_view(self) -> pygame.Rect:
+        """Okno kamery do rysowania – między poprzednim a bieżącym krokiem."""
+        if self._interp_cam is None or self._alpha >= 1.0:
+            return self.viewport()
+        (x0, y0), a = self._interp_cam, self._alpha
+        return pygame.Rect(int(x0 + (self.camera.x - x0) * a),
+                           int(y0 + (self.camera.y - y0) * a), WIDTH, HEIGHT)
+
+    @contextmanager
+    def _interpolated(self, visible: set):
+        """Na czas rysowania cofa widoczne sprite'y o (1 - alpha) ostatniego ruchu."""
+        moved = []
+        a = self._alpha
+        if a < 1.0:
+            for spr, (x0, y0) in self._interp_prev.items():
+                r = spr.rect
+                x1, y1 = r.topleft
+                if spr not in visible or (x0 == x1 and y0 == y1) \
+                        or abs(x1 - x0) + abs(y1 - y0) > self.INTERP_MAX_JUMP:
+                    continue                 # stoi / teleport (restart, respawn)
+                r.topleft = (round(x0 + (x1 - x0) * a), round(y0 + (y1 - y0) * a))
+                moved.append((r, x1, y1))
+        try:
+            yield
+        finally:
+            for r, x1, y1 in moved:
+                r.topleft = (x1, y1)
+            self._drawn = visible
+
+    def draw(self, screen):
+        self.prof.lap("other")
+        view = self._render_view()
+        visible = self._visible(view)
+        self.prof.lap("draw.cull")
+        with self._interpolated(visible):
+            self._draw_scene(screen, view)
 
         # 7) HUD
         self.hud.draw(screen)
+        self.prof.lap("draw.hud")
+        self._dirty_prev = None          # tryb pełny – historia nieaktualna
 
+    # ------------------------------------------------------------
+    def _snapshot(self, view: pygame.Rect, visible: set) -> dict:
+        """sprite → (obraz, prostokąt na ekranie) z bieżącej klatki."""
+        ox, oy = -view.x, -view.y
+        return {spr: (spr.image,
+                      pygame.Rect(spr.rect.x + ox, spr.rect.y + oy, *spr.image.get_size()))
+                for spr in visible}
+
+    @staticmethod
+    def _merge_rects(rects: list[pygame.Rect]) -> list[pygame.Rect]:
+        """Skleja nachodzące prostokąty, by ograniczyć liczbę przerysowań."""
+        merged: list[pygame.Rect] = []
+        for r in rects:
+            r = r.clip(0, 0, WIDTH, HEIGHT)
+            if not r.width or not r.height:
+                continue
+            i = r.collidelist(merged)
+            while i != -1:
+                r = r.union(merged.pop(i))
+                i = r.collidelist(merged)
+            merged.append(r)
+        return merged
+
+    def draw_dirty(self, screen) -> list[pygame.Rect] | None:
+        """
+        Rysowanie z brudnymi prostokątami. Zwraca listę obszarów do
+        `pygame.display.update` albo None, gdy narysowano pełną klatkę
+        (pierwsza klatka lub ruch kamery) i trzeba zrobić `flip()`.
+        """
+        self.prof.lap("other")
+        view    = self._render_view()
+        visible = self._visible(view)
+        self.prof.lap("draw.cull")
+        with self._interpolated(visible):
+            return self._draw_dirty(screen, view, visible)
+
+    def _draw_dirty(self, screen, view: pygame.Rect, visible: set) -> list[pygame.Rect] | None:
+        snap    = self._snapshot(view, visible)
+        prev    = self._dirty_prev
+
+        if prev is None or self._dirty_view != view.topleft:
+            self._draw_scene(screen, view)
+            self._hud_rects = self.hud.draw(screen)
+            self._dirty_prev, self._dirty_view = snap, view.topleft
+            return None
+
+        dirty = list(self._hud_rects)            # HUD może się skurczyć
+        for spr, (img, r) in snap.items():
+            old = prev.get(spr)
+            if old is None:
+                dirty.append(r)
+            elif old[0] is not img or old[1] != r:
+                dirty += (old[1], r)
+        for spr, (_, r) in prev.items():
+            if spr not in snap:
+                dirty.append(r)
+
+        dirty = self._merge_rects(dirty)
+        for r in dirty:
+            screen.set_clip(r)
+            self._draw_scene(screen, view, {s for s in visible if snap[s][1].colliderect(r)})
+        screen.set_clip(None)
+
+        self._hud_rects = self.hud.draw(screen)
+        self._dirty_prev = snap
+        return dirty + self._hud_rects
@@ -0,0 +1,86 @@
+# src/levels/lod.py
+"""
+LOD ticków AI dla map gęstych od wrogów.
+
+Wróg w kadrze (z marginesem AI_LOD_VIEW_MARGIN) albo blisko gracza jest
+aktualizowany co klatkę; dalsi – co kilka klatek wg AI_LOD_TIERS, za to
+z dt zebranym od poprzedniego ticku. Terminy trzymamy w „kole czasu”
+(numer klatki → lista wrogów), więc w klatce dotykamy tylko tych, na
+których przyszła kolej, a dalecy wrogowie rozkładają się na kolejne klatki.
+Poziom odległości liczymy przy każdym ticku – zbliżający się wróg wraca
+do pełnej częstotliwości najpóźniej po AI_LOD_FAR klatkach.
+"""
+from __future__ import annotations
+
+import pygame
+
+from ..core.settings import AI_LOD_TIERS, AI_LOD_FAR, AI_LOD_VIEW_MARGIN
+
+
+def tick_period(dist2: float, on_screen: bool) -> int:
+    """Co ile klatek aktualizować wroga (dist2 – kwadrat dystansu do gracza)."""
+    if on_screen:
+        return 1
+    for radius, period in AI_LOD_TIERS:
+        if dist2 <= radius * radius:
+            return period
+    return AI_LOD_FAR
+
+
+class AIScheduler:
+    def __init__(self):
+        self.frame = 0
+        self.time  = 0.0
+        self._wheel: dict[int, list[tuple[pygame.sprite.Sprite, int]]] = {}
+        self._last:  dict[pygame.sprite.Sprite, float] = {}   # czas ostatniego ticku
+        self._gen:   dict[pygame.sprite.Sprite, int]   = {}   # unieważnia stare wpisy w kole
+        self._period: dict[pygame.sprite.Sprite, int]  = {}
+        self._serial = 0
+        self._phase  = 0
+
+    # ────────────────────────────────────────────────────────────
+    def add(self, spr) -> None:
+        """Nowy / obudzony wróg – pierwszy tick w najbliższej klatce."""
+        self._serial += 1
+        gen = self._gen[spr] = self._serial
+        self._last[spr] = self.time
+        self._wheel.setdefault(self.frame, []).append((spr, gen))
+
+    def remove(self, spr) -> None:
+        self._last.pop(spr, None)
+        self._gen.pop(spr, None)
+        self._period.pop(spr, None)
+
+    def __contains__(self, spr) -> bool:
+        return spr in self._last
+
+    def __len__(self) -> int:
+        return len(self._last)
+
+    # ────────────────────────────────────────────────────────────
+    def update(self, dt: float, level) -> None:
+        self.time += dt
+        due = self._wheel.pop(self.frame, ())
+        view = level.viewport().inflate(2 * AI_LOD_VIEW_MARGIN, 2 * AI_LOD_VIEW_MARGIN)
+        px, py = level.player.rect.center
+
+        for spr, gen in due:
+            if self._gen.get(spr) != gen:
+                continue                                # zdjęty / dodany ponownie
+            if not spr.alive():
+                self.remove(spr)
+                continue
+            spr.update(self.time - self._last[spr])
+            self._last[spr] = self.time
+
+            cx, cy = spr.rect.center
+            period = tick_period((cx - px) ** 2 + (cy - py) ** 2, view.colliderect(spr.rect))
+            delay = period
+            if period != self._period.get(spr):
+                # zmiana poziomu – pierwszy termin z przesunięciem, żeby dalecy
+                # wrogowie nie wpadali na tę samą klatkę
+                self._period[spr] = period
+                self._phase += 1
+                delay = 1 + self._phase % period
+            self._wheel.setdefault(self.frame + delay, []).append((spr, gen))
+        self.frame += 1
@@ -0,0 +1,119 @@
+# src/levels/render_queue.py
+"""
+Kolejka rysowania posortowana wg głębokości (rect.bottom).
+
+Posortowane kubełki trzymają tylko sprite'y z okna kamery – nie całą
+mapę. `show(visible)` dokłada do nich te, które weszły w kadr, i wyjmuje
+te, które z niego wyszły (bisect + insort); `update(spr)` przestawia
+sprite tylko wtedy, gdy zmienił mu się klucz. Koszt klatki zależy więc
+od tego, co na ekranie i co się ruszyło, a nie od wielkości mapy.
+Kubełki odpowiadają warstwom Level.draw:
+
+    below   – spadające (pod podłogą), wg rect.bottom
+    traps   – pułapki, w kolejności spawnu
+    main    – reszta świata (łącznie z drabinami), wg rect.bottom
+    ladders – drabiny rysowane na wierzchu, w kolejności spawnu
+"""
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from typing import Iterable
+
+import pygame
+
+BELOW, TRAPS, MAIN, LADDERS = "below", "traps", "main", "ladders"
+
+
+class RenderQueue:
+    def __init__(self, traps: pygame.sprite.Group, ladders: pygame.sprite.Group):
+        self.traps   = traps
+        self.ladders = ladders
+        # posortowane wpisy (klucz, nr spawnu, sprite) sprite'ów z okna kamery
+        self.buckets: dict[str, list[tuple[int, int, pygame.sprite.Sprite]]] = {
+            BELOW: [], TRAPS: [], MAIN: [], LADDERS: [],
+        }
+        # sprite → [(kubełek, wpis)] – drabina siedzi w dwóch kubełkach
+        self._entries: dict[pygame.sprite.Sprite, list[tuple[str, tuple]]] = {}
+        self._order:   dict[pygame.sprite.Sprite, int] = {}
+        self._serial = 0
+        self._shown: set = set()             # sprite'y obecne w kubełkach
+
+    # ────────────────────────────────────────────────────────────
+    def _place(self, spr) -> list[tuple[str, tuple]]:
+        """Kubełki i klucze, pod którymi sprite powinien teraz leżeć."""
+        n = self._order[spr]
+        if spr in self.traps:
+            return [(TRAPS, (0, n, spr))]
+        if getattr(spr, "falling_off", False):
+            return [(BELOW, (spr.rect.bottom, n, spr))]
+        entries = [(MAIN, (spr.rect.bottom, n, spr))]
+        if spr in self.ladders:
+            entries.append((LADDERS, (0, n, spr)))
+        return entries
+
+    def _insert(self, entries) -> None:
+        # (klucz, nr spawnu) są unikalne – porównanie nie dochodzi do sprite'ów
+        for bucket, entry in entries:
+            insort(self.buckets[bucket], entry)
+
+    def _delete(self, entries) -> None:
+        for bucket, entry in entries:
+            lst = self.buckets[bucket]
+            del lst[bisect_left(lst, entry)]
+
+    def add(self, spr) -> None:
+        if spr in self._entries:
+            self.update(spr)
+            return
+        self._order[spr] = self._serial
+        self._serial += 1
+        self._entries[spr] = self._place(spr)
+
+    def remove(self, spr) -> None:
+        entries = self._entries.pop(spr, None)
+        if entries is None:
+            return
+        if spr in self._shown:
+            self._shown.discard(spr)
+            self._delete(entries)
+        del self._order[spr]
+
+    def update(self, spr) -> None:
+        """Przestawia sprite tylko wtedy, gdy zmienił mu się kubełek lub rect.bottom."""
+        old = self._entries.get(spr)
+        if old is None:
+            self.add(spr)
+            return
+        new = self._place(spr)
+        if new == old:
+            return
+        if spr in self._shown:
+            self._delete(old)
+            self._insert(new)
+        self._entries[spr] = new
+
+    def show(self, visible: set) -> None:
+        """Kubełki = dokładnie sprite'y z `visible` (culling); przestawia tylko różnicę."""
+        shown, entries = self._shown, self._entries
+        for spr in shown - visible:
+            self._delete(entries[spr])
+        for spr in visible - shown:
+            e = entries.get(spr)
+            if e is None:
+                continue
+            self._insert(e)
+        self._shown = {spr for spr in visible if spr in entries}
+
+    # ────────────────────────────────────────────────────────────
+    def layers(self, only: Iterable | None = None) -> dict[str, list[pygame.sprite.Sprite]]:
+        """Sprite'y z okna w kolejności rysowania; `only` – podzbiór (np. brudny prostokąt)."""
+        if only is None:
+            return {bucket: [e[2] for e in lst] for bucket, lst in self.buckets.items()}
+        return {bucket: [e[2] for e in lst if e[2] in only]
+                for bucket, lst in self.buckets.items()}
+
+    def __contains__(self, spr) -> bool:
+        return spr in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,91 @@
+# src/levels/sectors.py
+"""
+Streaming encji po sektorach dla dużych map.
+
+Świat jest dzielony na kwadraty SECTOR_SIZE×SECTOR_SIZE. Aktywne są
+sektory pod kamerą plus SECTOR_MARGIN dookoła. Gdy zestaw się zmienia:
+
+    sektor wchodzi  – spawny z listy mapy są tworzone, uśpione encje wracają
+    sektor wychodzi – żywe encje są odpinane od grup i zwalniane
+
+Między zmianami co klatkę sprawdzamy tylko ruchome encje: która zawędrowała
+poza aktywne sektory, zasypia od razu, a nie dopiero przy ruchu kamery.
+
+Uśpiona encja nie jest obiektem – zostaje po niej rekord spawnu (x, y,
+wx, wy, znak) i krotka stanu z `BaseEntity.sleep_state` (pozycja, hp,
+timery, klatka). Przy budzeniu Level tworzy ją od nowa i wgrywa ten stan,
+więc żywe obiekty są tylko przy kamerze, a uśpione kosztują same krotki.
+Encje zabite w grze nie wracają. Gracza streaming nie dotyczy.
+"""
+from __future__ import annotations
+
+import pygame
+
+from ..core.settings import SECTOR_SIZE, SECTOR_MARGIN
+
+Key = tuple[int, int]
+
+
+class SectorStreamer:
+    def __init__(self, world_rect: pygame.Rect, spawns: list[tuple[int, int, int, int, str]],
+                 size: int = SECTOR_SIZE, margin: int = SECTOR_MARGIN):
+        self.world_rect = world_rect
+        self.size   = size
+        self.margin = margin
+        self.active: set[Key] = set()
+        # sektor → spawny jeszcze nie utworzone / encje uśpione (spawn, stan)
+        self._pending:  dict[Key, list[tuple[int, int, int, int, str]]] = {}
+        self._sleeping: dict[Key, list[tuple[tuple[int, int, int, int, str], tuple]]] = {}
+        for sp in spawns:
+            self._pending.setdefault(self.sector_of((sp[2], sp[3])), []).append(sp)
+
+    # ────────────────────────────────────────────────────────────
+    def sector_of(self, pt: tuple[int, int]) -> Key:
+        return ((pt[0] - self.world_rect.left) // self.size,
+                (pt[1] - self.world_rect.top) // self.size)
+
+    def _around(self, view: pygame.Rect) -> set[Key]:
+        m = self.margin
+        x0, y0 = self.sector_of(view.topleft)
+        x1, y1 = self.sector_of((view.right - 1, view.bottom - 1))
+        return {(sx, sy)
+                for sy in range(y0 - m, y1 + m + 1)
+                for sx in range(x0 - m, x1 + m + 1)}
+
+    @property
+    def sleeping(self) -> int:
+        return sum(len(v) for v in self._sleeping.values())
+
+    @property
+    def pending(self) -> int:
+        return sum(len(v) for v in self._pending.values())
+
+    # ────────────────────────────────────────────────────────────
+    def _sleep(self, level, sprites, want: set[Key]) -> None:
+        """Usypia żywe sprite'y (bez gracza), których sektor nie należy do `want`."""
+        for spr in sprites:
+            if spr is level.player or not spr.alive():
+                continue
+            key = self.sector_of(spr.rect.center)
+            if key not in want:
+                level._detach(spr)      # WalkerSystem oddaje tu stan do sprite'a
+                self._sleeping.setdefault(key, []).append((spr.spawn, spr.sleep_state()))
+
+    def update(self, level, view: pygame.Rect) -> None:
+        """Dopasowuje aktywne sektory do kamery i usypia encje, które z nich wyszły."""
+        want = self._around(view)
+        if want == self.active:
+            self._sleep(level, list(level._movers), want)
+            return
+
+        # usypiamy wszystko poza nowym zestawem (także encje, które zawędrowały dalej)
+        self._sleep(level, list(level.world), want)
+
+        for key in want - self.active:
+            for x, y, wx, wy, ch in self._pending.pop(key, ()):
+                level._attach(level._spawn(x, y, wx, wy, ch))
+            for spawn, state in self._sleeping.pop(key, ()):
+                spr = level._spawn(*spawn)
+                spr.wake(state)
+                level._attach(spr)
+        self.active = want
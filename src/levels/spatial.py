@@ -0,0 +1,110 @@
+# src/levels/spatial.py
+"""
+Równomierna siatka (spatial hash) dla sprite'ów poziomu.
+
+Każdy sprite trafia do wszystkich komórek, które przecina jego `rect`.
+Zapytanie `query(rect)` przegląda tylko komórki pod prostokątem, więc
+koszt zależy od liczby obiektów w okolicy, a nie od rozmiaru mapy.
+"""
+from __future__ import annotations
+
+import pygame
+
+from ..core.settings import TILE
+
+
+class SpatialHash:
+    def __init__(self, cell: int = TILE * 2, origin: tuple[int, int] = (0, 0)):
+        self.cell   = cell
+        self.origin = origin
+        self._cells: dict[tuple[int, int], set[pygame.sprite.Sprite]] = {}
+        self._spans: dict[pygame.sprite.Sprite, tuple[int, int, int, int]] = {}
+        self._order: dict[pygame.sprite.Sprite, int] = {}   # kolejność wstawienia
+        self._serial = 0
+
+    # ────────────────────────────────────────────────────────────
+    def _span(self, rect: pygame.Rect) -> tuple[int, int, int, int]:
+        """Zakres komórek (x0, y0, x1, y1) – włącznie – pokryty przez rect."""
+        c = self.cell
+        ox, oy = self.origin
+        return ((rect.left - ox) // c, (rect.top - oy) // c,
+                (rect.right - 1 - ox) // c, (rect.bottom - 1 - oy) // c)
+
+    def _link(self, spr, span) -> None:
+        x0, y0, x1, y1 = span
+        for cy in range(y0, y1 + 1):
+            for cx in range(x0, x1 + 1):
+                self._cells.setdefault((cx, cy), set()).add(spr)
+
+    def _unlink(self, spr, span) -> None:
+        x0, y0, x1, y1 = span
+        for cy in range(y0, y1 + 1):
+            for cx in range(x0, x1 + 1):
+                bucket = self._cells.get((cx, cy))
+                if bucket is None:
+                    continue
+                bucket.discard(spr)
+                if not bucket:
+                    del self._cells[(cx, cy)]
+
+    # ────────────────────────────────────────────────────────────
+    def insert(self, spr) -> None:
+        if spr in self._spans:
+            self.update(spr)
+            return
+        span = self._span(spr.rect)
+        self._spans[spr] = span
+        self._order[spr] = self._serial
+        self._serial += 1
+        self._link(spr, span)
+
+    def remove(self, spr) -> None:
+        span = self._spans.pop(spr, None)
+        if span is None:
+            return
+        self._order.pop(spr, None)
+        self._unlink(spr, span)
+
+    def update(self, spr) -> None:
+        """Przepina sprite, jeśli jego rect przeszedł do innych komórek."""
+        old = self._spans.get(spr)
+        if old is None:
+            self.insert(spr)
+            return
+        new = self._span(spr.rect)
+        if new == old:
+            return
+        self._unlink(spr, old)
+        self._link(spr, new)
+        self._spans[spr] = new
+
+    def query(self, rect: pygame.Rect) -> list[pygame.sprite.Sprite]:
+        """
+        Zwraca żywe sprite'y, których rect nachodzi na `rect`,
+        w kolejności wstawienia (tak jak iterowałaby je Group).
+        """
+        x0, y0, x1, y1 = self._span(rect)
+        found: set[pygame.sprite.Sprite] = set()
+        cells = self._cells
+        for cy in range(y0, y1 + 1):
+            for cx in range(x0, x1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    found.update(bucket)
+
+        hits, stale = [], []
+        for spr in found:
+            if not spr.alive():
+                stale.append(spr)
+            elif spr.rect.colliderect(rect):
+                hits.append(spr)
+        for spr in stale:                     # sprite zabity → sprzątamy
+            self.remove(spr)
+        hits.sort(key=self._order.__getitem__)
+        return hits
+
+    def __contains__(self, spr) -> bool:
+        return spr in self._spans
+
+    def __len__(self) -> int:
+        return len(self._spans)
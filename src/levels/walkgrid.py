@@ -0,0 +1,117 @@
+# src/levels/walkgrid.py
+"""
+Siatka chodliwości w przestrzeni kafli.
+
+Zamiast pytać pikselową maskę podłogi odwracamy rzut izometryczny:
+punkt świata → (x, y) kafla mapy ASCII → jeden bajt w siatce. Kafel
+(x, y) ma środek w
+
+    cx + (x - y) * SPX,   cy + (x + y) * SPY
+
+czyli romb o półosiach SPX × SPY; zaokrąglenie odwrotnej transformacji
+daje kafel, w którego rombie leży punkt (tile_at – pole przepływu, pułapki).
+
+Grafika płytki nie jest jednak dokładnie tym rombem – wystaje poza niego
+o kilka pikseli, a sąsiednie płytki zachodzą na siebie. `walkable` pyta
+więc o piksel płytki: układ kafli powtarza się co PW × PH pikseli, więc
+dla każdego piksela takiego okresu pamiętamy (bajt `cover`), które
+z kilku sąsiednich kafli (`offsets`) mają tam nieprzezroczysty piksel.
+Punkt stoi na podłodze, gdy któryś z nich jest w mapie podłogą – to samo,
+co dawna maska pikselowa całej podłogi, bez mapy wielkości świata.
+"""
+from __future__ import annotations
+
+from math import floor
+from typing import Iterable
+
+from ..core.settings import TILE
+
+SPX, SPY = TILE // 3, TILE // 6
+PW, PH   = 2 * SPX, 2 * SPY         # okres układu kafli (dwa kafle, o różnej parzystości)
+
+
+def plate_cover(masks, reach: int = 4) -> tuple[tuple[tuple[int, int], ...], bytes]:
+    """
+    Pokrycie okresu PW × PH płytkami: (przesunięcia kafli, bajt na piksel –
+    bit k = płytka kafla `offsets[k]` jest tam nieprzezroczysta). `masks` to
+    maski płytek wg parzystości (x + y), jak przy rysowaniu podłogi.
+    """
+    found = []
+    for dx in range(-reach, reach + 1):
+        for dy in range(-reach, reach + 1):
+            mask = masks[(dx + dy) % 2]
+            w, h = mask.get_size()
+            ox, oy = (dx - dy) * SPX, (dx + dy) * SPY     # róg płytki względem kafla odniesienia
+            bits = [(lx, ly) for ly in range(PH) for lx in range(PW)
+                    if 0 <= lx - ox < w and 0 <= ly - oy < h and mask.get_at((lx - ox, ly - oy))]
+            if bits:
+                found.append(((dx, dy), bits))
+    if len(found) > 8:
+        raise ValueError(f"płytka zachodzi na {len(found)} kafli – nie mieści się w bajcie")
+    cover = bytearray(PW * PH)
+    for k, (_, bits) in enumerate(found):
+        for lx, ly in bits:
+            cover[ly * PW + lx] |= 1 << k
+    return tuple(off for off, _ in found), bytes(cover)
+
+
+class WalkGrid:
+    def __init__(self, cols: int, rows: int, cells: bytes, center: tuple[float, float],
+                 origin: tuple[int, int], offsets: tuple[tuple[int, int], ...], cover: bytes):
+        self.cols  = cols
+        self.rows  = rows
+        self.cells = cells              # 1 = podłoga, wiersz po wierszu
+        self.cx, self.cy = center       # środek rombu kafla (0, 0) we współrzędnych świata
+        self.ox, self.oy = origin       # lewy górny róg płytki kafla (0, 0)
+        self.offsets = offsets          # z plate_cover()
+        self.cover   = cover
+        # bajt pokrycia → krotka przesunięć (różnych bajtów jest kilkanaście)
+        lists = {m: tuple(off for k, off in enumerate(offsets) if m >> k & 1) for m in set(cover)}
+        self._cover = [lists[m] for m in cover]
+
+    @classmethod
+    def from_tiles(cls, tiles: Iterable[tuple[int, int, int, int, str]],
+                   center: tuple[float, float], origin: tuple[int, int], masks) -> "WalkGrid":
+        tiles = list(tiles)
+        cols = max((t[0] for t in tiles), default=-1) + 1
+        rows = max((t[1] for t in tiles), default=-1) + 1
+        cells = bytearray(cols * rows)
+        for x, y, *_ in tiles:
+            cells[y * cols + x] = 1
+        return cls(cols, rows, bytes(cells), center, origin, *plate_cover(masks))
+
+    # ────────────────────────────────────────────────────────────
+    def tile_at(self, wx: float, wy: float) -> tuple[int, int]:
+        """Odwrotny rzut izometryczny: punkt świata → (x, y) kafla."""
+        u = (wx - self.cx) / SPX
+        v = (wy - self.cy) / SPY
+        return floor((v + u) * 0.5 + 0.5), floor((v - u) * 0.5 + 0.5)
+
+    def tile_center(self, tx: int, ty: int) -> tuple[float, float]:
+        return self.cx + (tx - ty) * SPX, self.cy + (tx + ty) * SPY
+
+    def walkable_tile(self, tx: int, ty: int) -> bool:
+        return 0 <= tx < self.cols and 0 <= ty < self.rows \
+            and self.cells[ty * self.cols + tx] == 1
+
+    def walkable(self, wx: float, wy: float) -> bool:
+        """True, gdy punkt świata leży na nieprzezroczystym pikselu płytki podłogi."""
+        return self.walkable_many(((wx, wy),))[0]
+
+    def walkable_many(self, points: Iterable[tuple[float, float]]) -> list[bool]:
+        """Wersja wsadowa `walkable` – jedna pętla dla wielu punktów / encji."""
+        ox, oy, cols, rows, cells, cover = self.ox, self.oy, self.cols, self.rows, self.cells, self._cover
+        out = []
+        for wx, wy in points:
+            # okres (i, j) → kafel odniesienia (i + j, j - i), piksel (lx, ly) w okresie
+            i, lx = divmod(floor(wx) - ox, PW)
+            j, ly = divmod(floor(wy) - oy, PH)
+            tx0, ty0 = i + j, j - i
+            for dx, dy in cover[ly * PW + lx]:
+                tx, ty = tx0 + dx, ty0 + dy
+                if 0 <= tx < cols and 0 <= ty < rows and cells[ty * cols + tx] == 1:
+                    out.append(True)
+                    break
+            else:
+                out.append(False)
+        return out
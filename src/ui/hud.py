@@ -2,25 +2,30 @@
 import time
 import pygame
 from ..core.settings import WIDTH
+from .text import font, TextCache
 
 class HUD:
     def __init__(self, game):
         self.game = game
-        self.font = pygame.font.Font(None, 24)
+        self.font = font(24)
+        self.text = TextCache(self.font)   # render tylko przy zmianie wartości
 
-    def draw(self, screen):
+    def draw(self, screen) -> list[pygame.Rect]:
+        """Rysuje HUD; zwraca prostokąty, które zajął (tryb brudnych prostokątów)."""
         # 1) HP
         hp_txt = f"HP: {self.game.player.hp}/{self.game.player.max_hp}"
-        hp_surf = self.font.render(hp_txt, True, (255, 0, 0))
-        screen.blit(hp_surf, (10, 10))
+        hp_surf = self.text.render("hp", hp_txt, (255, 0, 0))
+        hp_rect = screen.blit(hp_surf, (10, 10))
 
         # 2) SCORE
         score_val = getattr(self.game.states.state, "score", 0)
         sc_txt = f"Score: {score_val}"
-        sc_surf = self.font.render(sc_txt, True, (255, 173, 46))
-        screen.blit(sc_surf, (10, 10 + hp_surf.get_height() + 5))
+        sc_surf = self.text.render("score", sc_txt, (255, 173, 46))
+        sc_rect = screen.blit(sc_surf, (10, 10 + hp_surf.get_height() + 5))
 
         # 3) LEVEL #
         lvl_idx = getattr(self.game, "level_index", 0) + 1
-        lvl_surf = self.font.render(f"Level: {lvl_idx}", True, (200, 200, 200))
-        screen.blit(lvl_surf, (10, 10 + hp_surf.get_height() + sc_surf.get_height() + 10))
+        lvl_surf = self.text.render("level", f"Level: {lvl_idx}", (200, 200, 200))
+        lvl_rect = screen.blit(lvl_surf, (10, 10 + hp_surf.get_height() + sc_surf.get_height() + 10))
+
+        return [hp_rect, sc_rect, lvl_rect]
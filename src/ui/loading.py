@@ -0,0 +1,48 @@
+# src/ui/loading.py
+import time
+import pygame
+
+from ..core.settings import WIDTH, HEIGHT
+from ..core.startup import startup
+from ..utils.preload import Preloader
+from .text import font, TextCache
+
+
+class LoadingScreen:
+    """Lekki ekran ładowania: pasek postępu, dopóki preloader nie skończy."""
+
+    BAR_W, BAR_H = WIDTH // 2, 16
+
+    def __init__(self, game, preloader: Preloader | None = None):
+        self.game = game
+        self.preloader = preloader or Preloader()
+        self.text = TextCache(font(32))
+        self._t0 = time.perf_counter()
+
+    # ────────────────────────────────────────────────────────────────
+    # STATE-MACHINE HOOKS
+
+    def handle_event(self, event: pygame.event.Event):
+        pass
+
+    def update(self, dt: float):
+        self.preloader.poll()
+        if self.preloader.done:
+            startup.record("preload assets", time.perf_counter() - self._t0)
+            from .menu import MainMenu           # menu dopiero po załadowaniu assetów
+            with startup.step("MainMenu (pygame_menu)"):
+                self.game.states.change(MainMenu(self.game))
+
+    def draw(self, screen: pygame.Surface):
+        screen.fill((10, 10, 10))
+
+        pl = self.preloader
+        label = self.text.render("label", f"Loading... {pl.loaded}/{pl.total}", (255, 173, 46))
+        screen.blit(label, label.get_rect(center=(WIDTH // 2, HEIGHT // 2 - 30)))
+
+        bar = pygame.Rect(0, 0, self.BAR_W, self.BAR_H)
+        bar.center = (WIDTH // 2, HEIGHT // 2 + 10)
+        pygame.draw.rect(screen, (80, 60, 30), bar, 1)
+        fill = bar.inflate(-4, -4)
+        fill.width = int(fill.width * pl.progress)
+        pygame.draw.rect(screen, (255, 173, 46), fill)
@@ -2,7 +2,6 @@ import json
 from pathlib import Path
 
 import pygame
-import pygame_menu
 
 from ..core.settings import (
     WIDTH, HEIGHT, IMG_DIR,
@@ -12,7 +11,6 @@ from ..core.settings import (
 from ..utils.loader import set_master_volume
 from ..utils.save      import add_score, get_top
 from functools import partial
-from ..levels.level import Level
 
 
 class MainMenu:
@@ -21,6 +19,7 @@ class MainMenu:
     BG_PATH = IMG_DIR / "iso-menu" / "iso-meny.png"
 
     def __init__(self, game):
+        import pygame_menu                   # ciężki import – dopiero przy budowie menu
         self.game = game
 
         # ─── background image ──────────────────────────────────────────
@@ -67,6 +66,7 @@ class MainMenu:
         # ─────────────────────────────────────────────────────────────
     def _options(self):
         """Pod-menu ustawień: nick + głośność."""
+        import pygame_menu
         sub_theme = self.menu.get_theme().copy()
         sub_theme.background_color = (10, 35, 80)          # ciemny niebieski
         sub_theme.title_font_size   = 40
@@ -129,6 +129,7 @@ class MainMenu:
 # ─────────────────────────────────────────────────────────────
     def _open_scores(self):
         """Wyświetla TOP-5 dla każdego poziomu w mniejszym, wyśrodkowanym oknie."""
+        import pygame_menu
 
         sub_theme = self.menu.get_theme().copy()
         sub_theme.background_color = (10, 35, 80)          # ciemny niebieski
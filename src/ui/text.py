@@ -0,0 +1,34 @@
+# src/ui/text.py
+"""
+Cache tekstu dla HUD i ekranów końcowych.
+
+`font()` trzyma obiekty Font przy życiu między klatkami, a `TextCache`
+renderuje etykietę ponownie tylko wtedy, gdy zmienił się jej tekst lub kolor.
+"""
+from __future__ import annotations
+
+from functools import lru_cache
+
+import pygame
+
+
+@lru_cache(maxsize=16)
+def font(size: int, name: str | None = None) -> pygame.font.Font:
+    """Wspólny Font dla (nazwa, rozmiar) – tworzony raz."""
+    return pygame.font.Font(name, size)
+
+
+class TextCache:
+    def __init__(self, fnt: pygame.font.Font, antialias: bool = True):
+        self.font      = fnt
+        self.antialias = antialias
+        # etykieta → (tekst, kolor, gotowa powierzchnia)
+        self._labels: dict[str, tuple[str, tuple, pygame.Surface]] = {}
+
+    def render(self, label: str, text: str, color) -> pygame.Surface:
+        cached = self._labels.get(label)
+        if cached is not None and cached[0] == text and cached[1] == color:
+            return cached[2]
+        surf = self.font.render(text, self.antialias, color)
+        self._labels[label] = (text, color, surf)
+        return surf
@@ -0,0 +1,126 @@
+# src/utils/atlas.py
+"""
+Atlas tekstur – krok budowania dla assets/images/.
+
+Wszystkie małe klatki (≤ ATLAS_MAX_FRAME px) są pakowane półkowo do kilku
+arkuszy ATLAS_SHEET×ATLAS_SHEET, a indeks atlas.json zapisuje dla każdej
+nazwy arkusz i prostokąt. Loader serwuje potem klatki jako subsurface
+arkusza – jeden odczyt PNG zamiast kilkudziesięciu.
+
+Klatki są pakowane w pełnym rozmiarze (bez przycinania przezroczystych
+brzegów), bo encje liczą rect z rozmiaru obrazu.
+
+Indeks zapisuje też klasę każdej klatki (opaque / colorkey / alpha, jak
+`loader.classify`), więc loader dobiera jej format bez ponownej analizy
+pikseli. Pamięta również mtime i rozmiar każdego źródłowego PNG. Klatka, której
+plik zmienił się od budowania (albo indeks jest ze starszej wersji), nie
+jest brana z atlasu – loader czyta wtedy sam PNG, aż do przebudowania:
+
+    python -m src.utils.atlas
+"""
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pygame
+
+from ..core.settings import IMG_DIR, ATLAS_DIR, ATLAS_SHEET, ATLAS_MAX_FRAME
+
+INDEX_FILE = "atlas.json"
+FORMAT     = 3                                      # 2: znaczniki źródeł ("src"), 3: klasy klatek ("kind")
+
+
+# ────────────────────────────────────────────────────────────────
+# BUDOWANIE
+
+def stamp(path: Path) -> list[int] | None:
+    """[mtime_ns, rozmiar] pliku źródłowego albo None, gdy go nie ma."""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+
+def _collect() -> list[tuple[str, pygame.Surface]]:
+    """(nazwa względem IMG_DIR, obraz) dla wszystkich małych PNG."""
+    found = []
+    for path in sorted(IMG_DIR.rglob("*.png")):
+        try:
+            surf = pygame.image.load(path)
+        except pygame.error:
+            continue                                # uszkodzony / nie-PNG
+        w, h = surf.get_size()
+        if w > ATLAS_MAX_FRAME or h > ATLAS_MAX_FRAME:
+            continue                                # tła zostają osobno
+        found.append((path.relative_to(IMG_DIR).as_posix(), surf))
+    return found
+
+
+def _pack(sizes: list[tuple[int, int]], sheet: int) -> list[tuple[int, int, int]]:
+    """Pakowanie półkowe: dla każdego rozmiaru (arkusz, x, y)."""
+    placed: list[tuple[int, int, int]] = [(0, 0, 0)] * len(sizes)
+    order = sorted(range(len(sizes)), key=lambda i: (-sizes[i][1], -sizes[i][0]))
+    idx = x = y = shelf_h = 0
+    for i in order:
+        w, h = sizes[i]
+        if x + w > sheet:                           # nowa półka
+            x, y, shelf_h = 0, y + shelf_h, 0
+        if y + h > sheet:                           # nowy arkusz
+            idx, x, y, shelf_h = idx + 1, 0, 0, 0
+        placed[i] = (idx, x, y)
+        x += w
+        shelf_h = max(shelf_h, h)
+    return placed
+
+
+def build(out_dir: Path = ATLAS_DIR, sheet: int = ATLAS_SHEET) -> dict:
+    """Buduje arkusze i indeks; zwraca zapisany indeks."""
+    from .loader import classify                    # loader importuje ten moduł
+    frames = _collect()
+    placed = _pack([s.get_size() for _, s in frames], sheet)
+
+    n_sheets = max((p[0] for p in placed), default=-1) + 1
+    sheets = [pygame.Surface((sheet, sheet), pygame.SRCALPHA) for _ in range(n_sheets)]
+    index = {"format": FORMAT, "sheets": [f"atlas_{i}.png" for i in range(n_sheets)], "frames": {}}
+
+    used = [1] * n_sheets                           # zajęta wysokość arkusza
+    for (name, surf), (idx, x, y) in zip(frames, placed):
+        # RGBA_MAX na pustym arkuszu = surowa kopia (zwykły blit mnożyłby kolor przez alfę)
+        sheets[idx].blit(surf, (x, y), special_flags=pygame.BLEND_RGBA_MAX)
+        index["frames"][name] = {"sheet": idx, "rect": [x, y, *surf.get_size()],
+                                 "src": stamp(IMG_DIR / name), "kind": classify(surf)}
+        used[idx] = max(used[idx], y + surf.get_height())
+
+    out_dir.mkdir(parents=True, exist_ok=True)
+    for i, s in enumerate(sheets):
+        # przytnij pusty dół arkusza
+        pygame.image.save(s.subsurface((0, 0, sheet, used[i])), out_dir / index["sheets"][i])
+    (out_dir / INDEX_FILE).write_text(json.dumps(index, indent=1))
+    return index
+
+
+# ────────────────────────────────────────────────────────────────
+# ODCZYT (używany przez loader)
+
+def load_index(out_dir: Path = ATLAS_DIR) -> dict | None:
+    """Indeks atlasu albo None, gdy atlas nie został zbudowany."""
+    path = out_dir / INDEX_FILE
+    if not path.exists():
+        return None
+    try:
+        index = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return None
+    return index if index.get("format") == FORMAT else None      # stary indeks → same PNG
+
+
+def is_current(name: str, entry: dict) -> bool:
+    """Czy klatka w atlasie odpowiada dzisiejszemu plikowi assets/images/<name>."""
+    return entry.get("src") is not None and entry["src"] == stamp(IMG_DIR / name)
+
+
+if __name__ == "__main__":
+    idx = build()
+    print(f"atlas: {len(idx['frames'])} klatek w {len(idx['sheets'])} arkuszach → {ATLAS_DIR}")
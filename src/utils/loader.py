@@ -1,6 +1,8 @@
 from __future__ import annotations
 from functools import lru_cache
 from pathlib import Path
+from typing import BinaryIO, Callable
+from weakref import WeakKeyDictionary
 
 import pygame
 
@@ -9,26 +11,197 @@ import pygame
 
 from ..core.settings import (
     IMG_DIR,          # assets/images/
+    ANIM_CACHE_DIR,   # cache/anims/ – przeskalowane klatki na dysku
+    ATLAS_DIR,        # assets/atlas/ – arkusze z `python -m src.utils.atlas`
+    BAKE_SCALED_ANIMS,
     SND_DIR,          # assets/sounds/
     DEFAULT_VOLUME,   # domyślna głośność (0–1)
     MUSIC_FILE        # np. "music.mp3"
 )
 
+from .atlas import load_index, is_current
+
+# ────────────────────────────────────────────────────────────────
+# INICJALIZACJA PYGAME MIXER – przy pierwszym użyciu, nie przy imporcie
+
+def ensure_mixer() -> None:
+    if not pygame.mixer.get_init():
+        pygame.mixer.init()
+
+# ────────────────────────────────────────────────────────────────
+# PRZYGOTOWANIE POWIERZCHNI
+#
+# Każdy obraz trafia do jednej z trzech grup i dostaje najszybszy format:
+#   opaque   – brak przezroczystości      → convert()            (zwykła kopia)
+#   colorkey – alfa tylko 0 albo 255      → convert() + colorkey + RLE
+#   alpha    – prawdziwa alfa (krawędzie) → convert_alpha() (+ RLE na życzenie)
+#
+# RLE dla prawdziwej alfy jest opcjonalne: blit jest szybszy, ale każde
+# zablokowanie powierzchni (maska, copy) rozpakowuje ją od nowa, a mieszanie
+# różni się o ±1 – co przesuwa progi masek podłogi.
+
+OPAQUE, COLORKEY, ALPHA = "opaque", "colorkey", "alpha"
+
+# kandydaci na kolor-klucz (pierwszy nieużywany w obrazie wygrywa)
+_COLORKEYS = ((255, 0, 255), (0, 255, 255), (255, 255, 0), (1, 2, 3))
+
+# nazwa assetu → wybrany format, np. "colorkey+rle" (raport)
+_formats: dict[str, str] = {}
+
+
+def classify(surf: pygame.Surface) -> str:
+    """Zwraca OPAQUE / COLORKEY / ALPHA dla powierzchni z kanałem alfa."""
+    w, h = surf.get_size()
+    solid = pygame.mask.from_surface(surf, 254).count()     # alfa == 255
+    if solid == w * h:
+        return OPAQUE
+    if solid == pygame.mask.from_surface(surf, 0).count():  # alfa > 0
+        return COLORKEY
+    return ALPHA
+
+
+def _free_colorkey(surf: pygame.Surface) -> tuple[int, int, int] | None:
+    """Kolor-klucz, którego nie ma wśród nieprzezroczystych pikseli."""
+    for key in _COLORKEYS:
+        if not pygame.mask.from_threshold(surf, (*key, 255), (1, 1, 1, 1)).count():
+            return key
+    return None
+
+
+def prepare(surf: pygame.Surface, name: str | None = None,
+            opaque: bool = False, rle: bool = False) -> pygame.Surface:
+    """
+    Dobiera format powierzchni do jej zawartości (patrz wyżej).
+    `opaque=True` spłaszcza obraz na czarnym tle – dla pełnoekranowych teł.
+    `rle=True` włącza RLE także dla prawdziwej alfy (tylko do samego blitowania).
+    `name` – pod tą nazwą format trafia do raportu `asset_formats()`.
+    """
+    src = surf.convert_alpha()
+    kind = OPAQUE if opaque else classify(src)
+
+    if kind == COLORKEY:
+        key = _free_colorkey(src)
+        if key is None:
+            kind = ALPHA                    # brak wolnego koloru – zostaje alfa
+        else:
+            out = pygame.Surface(src.get_size()).convert()
+            out.fill(key)
+            out.blit(src, (0, 0))
+            out.set_colorkey(key, pygame.RLEACCEL)
+
+    if kind == OPAQUE:
+        out = pygame.Surface(src.get_size()).convert()
+        out.fill((0, 0, 0))
+        out.blit(src, (0, 0))
+    elif kind == ALPHA:
+        out = src
+        if rle:
+            out.set_alpha(255, pygame.RLEACCEL)
+
+    if name is not None:
+        rle_on = out.get_flags() & (pygame.RLEACCEL | pygame.RLEACCELOK)
+        _formats[name] = kind + ("+rle" if rle_on else "")
+    return out
+
+
+def asset_formats() -> dict[str, str]:
+    """Raport: nazwa assetu → opaque / colorkey+rle / alpha (…+rle)."""
+    return dict(_formats)
+
 # ────────────────────────────────────────────────────────────────
-# INICJALIZACJA PYGAME MIXER
+# PRZEKAZANIE Z PRELOADERA
+#
+# Preloader (utils/preload.py) dekoduje pliki w wątkach roboczych i podaje
+# surowe obiekty na czas wywołania `load` (np. `image(name)`), które zabiera
+# je zamiast czytać dysk. Gdy `load` trafi w cache i nic nie zabierze,
+# obiekt przepada od razu – nic nie zalega do końca sesji.
+
+_decoded_images: dict[Path, pygame.Surface] = {}
+_decoded_sounds: dict[str, pygame.mixer.Sound] = {}
+
+
+def offer_image(path: Path, surf: pygame.Surface, load: Callable[[], object]) -> None:
+    _decoded_images[path] = surf
+    try:
+        load()
+    finally:
+        _decoded_images.pop(path, None)
 
-pygame.mixer.init()
+
+def offer_sound(name: str, snd: pygame.mixer.Sound, load: Callable[[], object]) -> None:
+    _decoded_sounds[name] = snd
+    try:
+        load()
+    finally:
+        _decoded_sounds.pop(name, None)
+
+
+def _load_surface(path: Path) -> pygame.Surface:
+    surf = _decoded_images.pop(path, None)
+    return surf if surf is not None else pygame.image.load(path)
 
 # ────────────────────────────────────────────────────────────────
 # ŁADOWANIE GRAFIKI
 
+@lru_cache(maxsize=1)
+def atlas_index() -> dict | None:
+    """Indeks atlasu (nazwa → arkusz, rect) albo None, gdy go nie zbudowano."""
+    return load_index(ATLAS_DIR)
+
+
+@lru_cache(maxsize=512)
+def atlas_entry(name: str) -> dict | None:
+    """Wpis atlasu dla `name` – None, gdy go nie ma albo PNG zmienił się od budowania."""
+    atlas = atlas_index()
+    entry = atlas["frames"].get(name) if atlas else None
+    return entry if entry is not None and is_current(name, entry) else None
+
+
+@lru_cache(maxsize=16)
+def atlas_sheet(idx: int) -> pygame.Surface:
+    """Arkusz zawsze z alfą – klatki opaque / colorkey i tak dostają własny format."""
+    return _load_surface(ATLAS_DIR / atlas_index()["sheets"][idx]).convert_alpha()
+
+
 @lru_cache(maxsize=256)
-def image(name: str) -> pygame.Surface:
+def image(name: str, opaque: bool = False) -> pygame.Surface:
     """
-    Ładuje grafikę z assets/images/<name> i zwraca ją jako Surface z alpha.
+    Ładuje grafikę z assets/images/<name> w formacie dobranym przez `prepare`.
     `name` może zawierać podkatalogi, np. "iso_block/iso_block_1.png".
+    `opaque=True` – pełnoekranowe tło, rysowane jako zwykła kopia.
+    Jeśli klatka jest w atlasie (i aktualna), nie czytamy PNG: klatka z
+    alfą to subsurface arkusza, a opaque / colorkey (klasa z atlas.json)
+    dostaje z niego własną powierzchnię w swoim formacie.
     """
-    return pygame.image.load(IMG_DIR / name).convert_alpha()
+    entry = atlas_entry(name) if not opaque else None
+    if entry is not None:
+        frame = atlas_sheet(entry["sheet"]).subsurface(entry["rect"])
+        if entry["kind"] != ALPHA:
+            return prepare(frame, name)
+        _formats[name] = ALPHA
+        return frame
+    return prepare(_load_surface(IMG_DIR / name), name, opaque)
+
+
+def has_image(name: str) -> bool:
+    """Czy grafika istnieje – najpierw indeks atlasu, dopiero potem dysk."""
+    return atlas_entry(name) is not None or (IMG_DIR / name).exists()
+
+# ────────────────────────────────────────────────────────────────
+# MASKI KOLIZJI – jedna na klatkę, wspólna dla wszystkich instancji
+
+_masks: WeakKeyDictionary[pygame.Surface, pygame.mask.Mask] = WeakKeyDictionary()
+
+
+def frame_mask(surf: pygame.Surface) -> pygame.mask.Mask:
+    """
+    Maska klatki liczona leniwie, przy pierwszym zapytaniu o kolizję.
+    Klucz to sama powierzchnia, więc wpis znika razem z klatką.
+    """
+    m = _masks.get(surf)
+    if m is None:
+        m = _masks[surf] = pygame.mask.from_surface(surf)
+    return m
 
 # ────────────────────────────────────────────────────────────────
 # ŁADOWANIE DŹWIĘKU
@@ -36,8 +209,12 @@ def image(name: str) -> pygame.Surface:
 @lru_cache(maxsize=64)
 def sound(name: str) -> pygame.mixer.Sound:
     """
-    Ładuje efekt z assets/sounds/<name>.
+    Ładuje efekt z assets/sounds/<name> (albo bierze zdekodowany przez preloader).
     """
+    snd = _decoded_sounds.pop(name, None)
+    if snd is not None:
+        return snd
+    ensure_mixer()
     return pygame.mixer.Sound(SND_DIR / name)
 
 
@@ -46,6 +223,7 @@ def set_master_volume(vol: float) -> None:
     Globalna regulacja głośności (0–1) – obejmuje muzykę i wszystkie kanały.
     """
     vol = max(0.0, min(1.0, vol))
+    ensure_mixer()
     pygame.mixer.music.set_volume(vol)
     for i in range(pygame.mixer.get_num_channels()):
         pygame.mixer.Channel(i).set_volume(vol)
@@ -60,19 +238,22 @@ def play(name: str) -> None:
     snd.play()
 
 # ────────────────────────────────────────────────────────────────
-# MUZYKA W TLE – inicjowana jednokrotnie
+# MUZYKA W TLE – startowana raz, przez preloader (nie przy imporcie)
 
-def _init_music() -> None:
+def start_music(data: BinaryIO | None = None) -> None:
     """
     Ładuje i zapętla podkład muzyczny, jeśli jeszcze nie gra.
+    `data` – plik muzyki wczytany wcześniej do pamięci (preloader).
     """
+    ensure_mixer()
     if not pygame.mixer.music.get_busy():
-        pygame.mixer.music.load(SND_DIR / MUSIC_FILE)
+        if data is not None:
+            pygame.mixer.music.load(data, Path(MUSIC_FILE).suffix[1:])
+        else:
+            pygame.mixer.music.load(SND_DIR / MUSIC_FILE)
         pygame.mixer.music.set_volume(DEFAULT_VOLUME)
         pygame.mixer.music.play(-1)      # pętla nieskończona
 
-_init_music()
-
 # ────────────────────────────────────────────────────────────────
 # POMOCNICZE: sprite-sheet → klatki
 
@@ -98,8 +279,7 @@ def load_animation(folder: str, count: int) -> list[pygame.Surface]:
     frames: list[pygame.Surface] = []
     for i in range(1, count + 1):
         rel = f"{folder}/{folder}_{i}.png"
-        path = IMG_DIR / rel
-        if path.exists():
+        if has_image(rel):
             frames.append(image(rel))
         else:
             if frames:
@@ -109,6 +289,75 @@ def load_animation(folder: str, count: int) -> list[pygame.Surface]:
     return frames
 
 
+def _scale(frame: pygame.Surface, scale: float) -> pygame.Surface:
+    w, h = frame.get_size()
+    return pygame.transform.scale(frame, (int(w * scale), int(h * scale)))
+
+
+def _baked_dir(folder: str, count: int, scale: float) -> Path:
+    return ANIM_CACHE_DIR / f"{folder}@{scale:g}x{count}"
+
+
+def _load_baked(folder: str, count: int, scale: float) -> list[pygame.Surface] | None:
+    """Klatki z dysku, o ile są wszystkie i nowsze od źródłowych PNG."""
+    out_dir = _baked_dir(folder, count, scale)
+    frames: list[pygame.Surface] = []
+    for i in range(1, count + 1):
+        baked = out_dir / f"{i}.png"
+        src   = IMG_DIR / folder / f"{folder}_{i}.png"
+        if not baked.exists():
+            return None
+        if src.exists() and src.stat().st_mtime > baked.stat().st_mtime:
+            return None                             # źródło zmienione → przelicz
+        # własna nazwa w raporcie – wpis źródłowego PNG zostaje nietknięty
+        frames.append(prepare(pygame.image.load(baked), f"baked:{out_dir.name}/{i}"))
+    return frames
+
+
+def _bake(folder: str, count: int, scale: float, frames) -> None:
+    out_dir = _baked_dir(folder, count, scale)
+    try:
+        out_dir.mkdir(parents=True, exist_ok=True)
+        for i, f in enumerate(frames, 1):
+            pygame.image.save(f, out_dir / f"{i}.png")
+    except (OSError, pygame.error):
+        pass                                        # cache tylko przyspiesza
+
+
+@lru_cache(maxsize=64)
+def scaled_animation(folder: str, count: int, scale: float = 1.0) -> tuple[pygame.Surface, ...]:
+    """
+    Animacja przeskalowana o `scale`, wspólna dla wszystkich instancji
+    (klucz: folder, count, scale). Zwraca krotkę – nie wolno jej modyfikować.
+    Przy BAKE_SCALED_ANIMS klatki są zapisywane w cache/anims/, więc kolejne
+    uruchomienia pomijają skalowanie.
+    """
+    if scale == 1.0:
+        return tuple(load_animation(folder, count))
+
+    if BAKE_SCALED_ANIMS:
+        baked = _load_baked(folder, count, scale)
+        if baked is not None:
+            return tuple(baked)
+
+    scaled: dict[pygame.Surface, pygame.Surface] = {}   # duplikaty skalujemy raz
+    frames = []
+    for f in load_animation(folder, count):
+        if f not in scaled:
+            scaled[f] = _scale(f, scale)
+        frames.append(scaled[f])
+
+    if BAKE_SCALED_ANIMS:
+        _bake(folder, count, scale, frames)
+    return tuple(frames)
+
+
+@lru_cache(maxsize=64)
+def scaled_image(name: str, scale: float) -> pygame.Surface:
+    """Pojedyncza grafika przeskalowana o `scale`, wspólna dla instancji."""
+    return _scale(image(name), scale)
+
+
 def load_images_from_folder(folder: str) -> list[pygame.Surface]:
     """
     Zwraca wszystkie .png z assets/images/<folder>/ posortowane alfabetycznie.
@@ -120,5 +369,6 @@ def load_images_from_folder(folder: str) -> list[pygame.Surface]:
     frames: list[pygame.Surface] = []
     for file in sorted(dir_path.iterdir()):
         if file.suffix.lower() == ".png":
-            frames.append(pygame.image.load(file).convert_alpha())
+            rel = f"{folder}/{file.name}"
+            frames.append(prepare(pygame.image.load(file), rel))
     return frames
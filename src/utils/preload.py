@@ -0,0 +1,127 @@
+# src/utils/preload.py
+"""
+Preloader assetów w tle.
+
+Pliki z manifestu (grafiki, efekty, muzyka) są dekodowane w puli wątków;
+główny wątek w `poll()` odbiera gotowe wyniki i przekazuje je do cache
+loadera (`image` / `sound`) – tam, gdzie potrzebny jest ekran (convert),
+dzieje się to już na głównym wątku, w limicie czasu na klatkę.
+"""
+from __future__ import annotations
+
+import io
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable
+
+import pygame
+
+from ..core.settings import (
+    IMG_DIR, SND_DIR, ATLAS_DIR, MUSIC_FILE,
+    SND_JUMP, SND_PUNCH, SND_GAME_OVER,
+    PRELOAD_WORKERS,
+)
+from . import loader
+
+# obrazy ładowane przez pygame_menu (nie przez loader) – pomijamy
+_SKIP_DIRS = {"iso-menu"}
+# pełnoekranowe tła → image(name, opaque=True)
+BACKGROUNDS = ("bgn/bgn.png",)
+SOUNDS      = (SND_JUMP, SND_PUNCH, SND_GAME_OVER)
+
+
+# zadanie: (etykieta, dekodowanie w wątku, przekazanie na głównym wątku)
+Task = tuple[str, Callable[[], object], Callable[[object], None]]
+
+
+def _image_task(name: str, opaque: bool = False) -> Task:
+    path = IMG_DIR / name
+
+    def accept(surf):
+        if opaque:                                # ten sam klucz cache co w Level
+            loader.offer_image(path, surf, lambda: loader.image(name, opaque=True))
+        else:
+            loader.offer_image(path, surf, lambda: loader.image(name))
+
+    return name, lambda: pygame.image.load(path), accept
+
+
+def _sheet_task(idx: int, fname: str) -> Task:
+    path = ATLAS_DIR / fname
+
+    def accept(surf):
+        loader.offer_image(path, surf, lambda: loader.atlas_sheet(idx))
+
+    return fname, lambda: pygame.image.load(path), accept
+
+
+def _sound_task(name: str) -> Task:
+    def accept(snd):
+        loader.offer_sound(name, snd, lambda: loader.sound(name))
+
+    return name, lambda: pygame.mixer.Sound(SND_DIR / name), accept
+
+
+def _music_task() -> Task:
+    # muzyka jest strumieniowana – w tle czytamy tylko plik do pamięci
+    return (MUSIC_FILE,
+            lambda: io.BytesIO((SND_DIR / MUSIC_FILE).read_bytes()),
+            loader.start_music)
+
+
+def default_manifest() -> list[Task]:
+    """Wszystko, czego gra potrzebuje przed pierwszym poziomem."""
+    loader.ensure_mixer()              # Sound() w wątkach wymaga gotowego miksera
+    tasks: list[Task] = []
+    atlas = loader.atlas_index()
+    if atlas:
+        tasks += [_sheet_task(i, f) for i, f in enumerate(atlas["sheets"])]
+
+    for path in sorted(IMG_DIR.glob("*/*.png")):
+        name = path.relative_to(IMG_DIR).as_posix()
+        if path.parent.name in _SKIP_DIRS or loader.atlas_entry(name) is not None:
+            continue
+        tasks.append(_image_task(name, opaque=name in BACKGROUNDS))
+
+    tasks += [_sound_task(n) for n in SOUNDS]
+    tasks.append(_music_task())
+    return tasks
+
+
+class Preloader:
+    def __init__(self, tasks: list[Task] | None = None, workers: int = PRELOAD_WORKERS):
+        self.tasks   = default_manifest() if tasks is None else tasks
+        self.total   = len(self.tasks)
+        self.loaded  = 0
+        self.failed: list[tuple[str, Exception]] = []
+        self._pool   = ThreadPoolExecutor(max_workers=workers)
+        self._pending: list[tuple[Task, Future]] = [
+            (task, self._pool.submit(task[1])) for task in self.tasks
+        ]
+
+    @property
+    def progress(self) -> float:
+        return 1.0 if not self.total else self.loaded / self.total
+
+    @property
+    def done(self) -> bool:
+        return not self._pending
+
+    def poll(self, budget_ms: float = 8.0) -> None:
+        """Przejmuje gotowe wyniki, dopóki nie skończy się budżet czasu klatki."""
+        deadline = time.perf_counter() + budget_ms / 1000.0
+        still: list[tuple[Task, Future]] = []
+        for task, fut in self._pending:
+            if not fut.done() or time.perf_counter() > deadline:
+                still.append((task, fut))
+                continue
+            label, _, accept = task
+            try:
+                accept(fut.result())
+            except (pygame.error, OSError) as exc:
+                self.failed.append((label, exc))    # brak pliku nie blokuje gry
+            self.loaded += 1
+        self._pending = still
+        if self.done:
+            self._pool.shutdown(wait=False)
@@ -19,7 +19,6 @@ from typing import List, Tuple
 
 from ..core.settings import SAVE_DIR
 
-SAVE_DIR.mkdir(exist_ok=True)
 _SCORES_PATH = SAVE_DIR / "scores.json"
 
 
@@ -31,6 +30,7 @@ def _load_raw() -> dict:
 
 
 def _dump_raw(data: dict) -> None:
+    SAVE_DIR.mkdir(exist_ok=True)          # przy zapisie, nie przy imporcie
     _SCORES_PATH.write_text(json.dumps(data, indent=2))
 
 